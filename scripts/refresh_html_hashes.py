@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import argparse
+import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from importlib import import_module
 from pathlib import Path
 from textwrap import dedent
 from typing import Dict
 
 ROOT = Path(__file__).resolve().parents[1]
+CACHE_PATH = Path(".cache") / "html_hash_cache.json"
+HASHES_PATH = Path("tests") / "html_hashes.json"
 
 
 def _load_baseline_module():
@@ -18,55 +23,62 @@ def _load_baseline_module():
         sys.path.pop(0)
 
 
+def _load_cache() -> dict[str, list]:
+    try:
+        return json.loads((ROOT / CACHE_PATH).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache: dict[str, list]) -> None:
+    cache_path = ROOT / CACHE_PATH
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps(cache, indent=2, sort_keys=True), encoding="utf-8")
+
+
 def _gather_hashes(expected: Dict[str, str]):
     baseline = _load_baseline_module()
+    cache = _load_cache()
     hashes: dict[str, str] = {}
+    stale: dict[str, tuple[int, int]] = {}
     missing: list[str] = []
 
     for rel_path in expected:
-        path = ROOT / rel_path
-        if not path.exists():
+        try:
+            stat = (ROOT / rel_path).stat()
+        except FileNotFoundError:
             missing.append(rel_path)
             continue
-        hashes[rel_path] = baseline.sha256_hex(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = cache.get(rel_path)
+        if cached is not None and tuple(cached[:2]) == key:
+            hashes[rel_path] = cached[2]
+        else:
+            hashes[rel_path] = ""
+            stale[rel_path] = key
+
+    if stale:
+        # hashlib releases the GIL while digesting, so threads overlap the work.
+        workers = min(32, (os.cpu_count() or 1) * 2, len(stale))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            digests = executor.map(baseline.sha256_hex, [ROOT / rel_path for rel_path in stale])
+            for (rel_path, key), digest in zip(stale.items(), digests):
+                hashes[rel_path] = digest
+                cache[rel_path] = [*key, digest]
+        _save_cache(cache)
 
     return hashes, missing
 
 
-def _format_mapping(mapping: dict[str, str]) -> list[str]:
-    lines = ["EXPECTED_SHA256 = {"]
-    for rel_path, digest in mapping.items():
-        lines.append(f'    "{rel_path}": "{digest}",')
-    lines.append("}")
-    return lines
-
-
-def _rewrite_test_file(mapping: dict[str, str]) -> None:
-    baseline_path = ROOT / "tests" / "test_html_baseline.py"
-    lines = baseline_path.read_text(encoding="utf-8").splitlines()
-
-    start = None
-    end = None
-    for idx, line in enumerate(lines):
-        if line.startswith("EXPECTED_SHA256 = {"):
-            start = idx
-            break
-    if start is None:
-        raise RuntimeError("Could not locate EXPECTED_SHA256 declaration in test_html_baseline.py")
+def _format_mapping(mapping: dict[str, str]) -> str:
+    return json.dumps(mapping, indent=2, sort_keys=True) + "\n"
 
-    brace_depth = 0
-    for idx in range(start, len(lines)):
-        brace_depth += lines[idx].count("{")
-        brace_depth -= lines[idx].count("}")
-        if brace_depth == 0:
-            end = idx
-            break
-    if end is None:
-        raise RuntimeError("Could not find end of EXPECTED_SHA256 mapping in test_html_baseline.py")
 
-    new_block = _format_mapping(mapping)
-    updated = lines[:start] + new_block + lines[end + 1 :]
-    baseline_path.write_text("\n".join(updated) + "\n", encoding="utf-8")
+def _write_mapping(mapping: dict[str, str]) -> None:
+    hashes_path = ROOT / HASHES_PATH
+    staging_path = hashes_path.with_suffix(".json.tmp")
+    staging_path.write_text(_format_mapping(mapping), encoding="utf-8")
+    os.replace(staging_path, hashes_path)
 
 
 def main() -> int:
@@ -76,7 +88,7 @@ def main() -> int:
         epilog=dedent(
             """
             Use --write when an intentional HTML change has landed on main and you want to
-            update tests/test_html_baseline.py. Without --write the script prints the new
+            update tests/html_hashes.json. Without --write the script prints the new
             mapping so you can review it manually.
             """
         ),
@@ -84,7 +96,7 @@ def main() -> int:
     parser.add_argument(
         "--write",
         action="store_true",
-        help="Overwrite tests/test_html_baseline.py with the refreshed mapping",
+        help="Overwrite tests/html_hashes.json with the refreshed mapping",
     )
     args = parser.parse_args()
 
@@ -97,12 +109,11 @@ def main() -> int:
         return 1
 
     if args.write:
-        _rewrite_test_file(hashes)
-        print("Updated tests/test_html_baseline.py with fresh hashes.")
+        _write_mapping(hashes)
+        print("Updated tests/html_hashes.json with fresh hashes.")
     else:
-        print("Paste this mapping into tests/test_html_baseline.py if the HTML changes were intentional:\n")
-        for line in _format_mapping(hashes):
-            print(line)
+        print("Paste this mapping into tests/html_hashes.json if the HTML changes were intentional:\n")
+        print(_format_mapping(hashes), end="")
     return 0
 
 
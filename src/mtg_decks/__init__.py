@@ -1,11 +1,6 @@
 """Utilities for storing and inspecting Commander decks as Markdown files."""
 
-from .deck import Deck
-from .importer import CardResolver, ImportResult, ScryfallResolver, import_deck
-from .inventory import SpareCard, SparesInventory, build_spare_cards
-from .library import DeckLibrary
-from .rules import CommanderRules, load_decklist, parse_decklist
-from .valuation import DeckValuation, DeckValuer, ValuationCache
+from importlib import import_module
 
 __version__ = "0.1.0"
 
@@ -23,14 +18,45 @@ __all__ = [
     "DeckValuation",
     "DeckValuer",
     "ValuationCache",
+    "ValidationCache",
     "__version__",
     "load_decklist",
     "parse_decklist",
     "validate_site_assets",
 ]
 
+# Public names are resolved from their submodules on first access so that
+# light-weight entry points (e.g. ``mtg-decks --version``) skip the imports.
+_LAZY = {
+    "Deck": ".deck",
+    "CardResolver": ".importer",
+    "ImportResult": ".importer",
+    "ScryfallResolver": ".importer",
+    "import_deck": ".importer",
+    "SpareCard": ".inventory",
+    "SparesInventory": ".inventory",
+    "build_spare_cards": ".inventory",
+    "DeckLibrary": ".library",
+    "CommanderRules": ".rules",
+    "load_decklist": ".rules",
+    "parse_decklist": ".rules",
+    "ValidationCache": ".rules",
+    "DeckValuation": ".valuation",
+    "DeckValuer": ".valuation",
+    "ValuationCache": ".valuation",
+    "validate_site_assets": ".site_checks",
+}
 
-def validate_site_assets(*args, **kwargs):
-    from .site_checks import validate_site_assets as _validate_site_assets
 
-    return _validate_site_assets(*args, **kwargs)
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
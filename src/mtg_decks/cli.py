@@ -3,49 +3,100 @@ from __future__ import annotations
 
 import argparse
 import datetime as _dt
+import functools
 import sys
 from pathlib import Path
 
 from . import __version__
 from .importer import ScryfallResolver
 from .config import load_config
-from .inventory import SparesInventory, build_spare_cards
-from .library import DeckLibrary
-from .rules import CommanderRules
-from .valuation import ValuationCache, render_valuation_report
 
 
-_APP_CONFIG = load_config()
+_CONFIG_DEFAULTS = (
+    ("currency", "default_currency", str.upper),
+    ("source", "valuation_source", None),
+    ("cache", "valuation_cache_path", None),
+)
+
+
+def _apply_config_defaults(args: argparse.Namespace) -> None:
+    """Fill options left unset on the command line from the app config.
+
+    ``convert`` mirrors the option's argparse ``type`` so config values are
+    normalised the same way as values typed on the command line.
+    """
+
+    for attr, field, convert in _CONFIG_DEFAULTS:
+        if hasattr(args, attr) and getattr(args, attr) is None:
+            value = getattr(load_config(), field)
+            setattr(args, attr, convert(value) if convert else value)
 
 
 def _resolver_from_source(source: str):
+    """Return the card resolver for ``source``, shared for the life of the process.
+
+    The resolver and its card cache are memoised by ``_resolver_for``; call
+    ``_resolver_for.cache_clear()`` to drop them, e.g. between tests.
+    """
+
     normalized = (source or "scryfall").lower()
-    if normalized == "scryfall":
-        return ScryfallResolver()
-    raise ValueError(f"Unsupported valuation source: {source}")
+    if normalized != "scryfall":
+        raise ValueError(f"Unsupported valuation source: {source}")
+    return _resolver_for(normalized, load_config().card_cache_path)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolver_for(normalized: str, card_cache_path: Path | None = None):
+    # Memoised so repeated in-process main() calls reuse one resolver per source.
+    from .importer import CardCache
+
+    cache = CardCache(card_cache_path) if card_cache_path is not None else None
+    return ScryfallResolver(cache=cache)
+
+
+_VERSION_FLAGS = ("--version", "-V")
 
 
-def build_parser() -> argparse.ArgumentParser:
+@functools.lru_cache(maxsize=None)
+def build_parser(only: str | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+
+    When ``only`` names a subcommand, just that subparser is registered so an
+    invocation does not pay to set up every other command.
+    """
+
     parser = argparse.ArgumentParser(
         description="Store and review Commander decks as Markdown files."
     )
-    parser.add_argument("--version", action="version", version=__version__)
+    parser.add_argument(*_VERSION_FLAGS, action="version", version=__version__)
     parser.add_argument(
         "--dir",
         dest="deck_dir",
-        default="decks",
+        type=Path,
+        default=Path("decks"),
         help="Directory where deck markdown files are stored (default: decks)",
     )
 
     subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, add_parser in _SUBCOMMAND_BUILDERS.items():
+        if only in (None, name):
+            add_parser(subparsers)
+
+    return parser
+
 
+def _add_list_parser(subparsers) -> None:
     list_parser = subparsers.add_parser("list", help="List decks in the library")
     list_parser.set_defaults(func=cmd_list)
 
+
+def _add_show_parser(subparsers) -> None:
     show_parser = subparsers.add_parser("show", help="Show details for a deck")
     show_parser.add_argument("name", help="Deck name or slug")
     show_parser.set_defaults(func=cmd_show)
 
+
+def _add_create_parser(subparsers) -> None:
     create_parser = subparsers.add_parser("create", help="Create a new deck file")
     create_parser.add_argument("name", help="Deck name")
     create_parser.add_argument("commander", help="Deck commander")
@@ -53,6 +104,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--colors",
         nargs="*",
         default=None,
+        type=str.upper,
         help="Color identity (e.g. W U B R G)",
     )
     create_parser.add_argument("--theme", help="Deck theme or archetype", default=None)
@@ -72,6 +124,8 @@ def build_parser() -> argparse.ArgumentParser:
     )
     create_parser.set_defaults(func=cmd_create)
 
+
+def _add_import_parser(subparsers) -> None:
     import_parser = subparsers.add_parser(
         "import", help="Import a deck from text or CSV using card lookups"
     )
@@ -92,6 +146,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--colors",
         nargs="*",
         default=None,
+        type=str.upper,
         help="Color identity to pin on the deck (otherwise inferred from the commander if available)",
     )
     import_parser.add_argument("--theme", help="Deck theme or archetype", default=None)
@@ -111,58 +166,70 @@ def build_parser() -> argparse.ArgumentParser:
     )
     import_parser.set_defaults(func=cmd_import)
 
+
+def _add_value_parser(subparsers) -> None:
     value_parser = subparsers.add_parser(
         "value", help="Estimate deck value using price lookups"
     )
     value_parser.add_argument("name", help="Deck name or slug")
     value_parser.add_argument(
         "--currency",
-        default=_APP_CONFIG.default_currency,
+        default=None,
+        type=str.upper,
         help=(
             "Three-letter currency code to price cards in "
-            f"(default: {_APP_CONFIG.default_currency.upper()})"
+            "(default: MTG_DECKS_CURRENCY or GBP)"
         ),
     )
     value_parser.add_argument(
         "--source",
-        default=_APP_CONFIG.valuation_source,
+        default=None,
         help=(
             "Price source to use for valuations "
-            f"(default: {_APP_CONFIG.valuation_source})"
+            "(default: MTG_DECKS_VALUATION_SOURCE or scryfall)"
         ),
     )
     value_parser.add_argument(
         "--cache",
         type=Path,
-        default=_APP_CONFIG.valuation_cache_path,
-        help="Path to a valuation cache file used to reuse recent totals",
+        default=None,
+        help=(
+            "Path to a valuation cache file used to reuse recent totals "
+            "(default: MTG_DECKS_VALUATION_CACHE or valuation-cache.json)"
+        ),
     )
     value_parser.set_defaults(func=cmd_value)
 
+
+def _add_value_all_parser(subparsers) -> None:
     value_all_parser = subparsers.add_parser(
         "value-all", help="Estimate value for all decks and optionally write a report"
     )
     value_all_parser.add_argument(
         "--currency",
-        default=_APP_CONFIG.default_currency,
+        default=None,
+        type=str.upper,
         help=(
             "Three-letter currency code to price cards in "
-            f"(default: {_APP_CONFIG.default_currency.upper()})"
+            "(default: MTG_DECKS_CURRENCY or GBP)"
         ),
     )
     value_all_parser.add_argument(
         "--source",
-        default=_APP_CONFIG.valuation_source,
+        default=None,
         help=(
             "Price source to use for valuations "
-            f"(default: {_APP_CONFIG.valuation_source})"
+            "(default: MTG_DECKS_VALUATION_SOURCE or scryfall)"
         ),
     )
     value_all_parser.add_argument(
         "--cache",
         type=Path,
-        default=_APP_CONFIG.valuation_cache_path,
-        help="Path to a valuation cache file used to reuse recent totals",
+        default=None,
+        help=(
+            "Path to a valuation cache file used to reuse recent totals "
+            "(default: MTG_DECKS_VALUATION_CACHE or valuation-cache.json)"
+        ),
     )
     value_all_parser.add_argument(
         "--report",
@@ -171,6 +238,8 @@ def build_parser() -> argparse.ArgumentParser:
     )
     value_all_parser.set_defaults(func=cmd_value_all)
 
+
+def _add_validate_parser(subparsers) -> None:
     validate_parser = subparsers.add_parser(
         "validate", help="Validate deck files against Commander rules"
     )
@@ -214,8 +283,15 @@ def build_parser() -> argparse.ArgumentParser:
         default=[],
         help="Card name to ban (repeat for multiple entries)",
     )
+    validate_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-validate every deck instead of reusing results for unchanged files",
+    )
     validate_parser.set_defaults(func=cmd_validate)
 
+
+def _add_spares_parser(subparsers) -> None:
     spares_parent = argparse.ArgumentParser(add_help=False)
     spares_parent.add_argument(
         "--spares-file",
@@ -226,10 +302,11 @@ def build_parser() -> argparse.ArgumentParser:
     )
     spares_parent.add_argument(
         "--currency",
-        default=_APP_CONFIG.default_currency,
+        default=None,
+        type=str.upper,
         help=(
             "Three-letter currency code to price cards in "
-            f"(default: {_APP_CONFIG.default_currency.upper()})"
+            "(default: MTG_DECKS_CURRENCY or GBP)"
         ),
     )
 
@@ -262,8 +339,11 @@ def build_parser() -> argparse.ArgumentParser:
     )
     spares_import.add_argument(
         "--source",
-        default=_APP_CONFIG.valuation_source,
-        help="Price source to use for valuations (default: scryfall)",
+        default=None,
+        help=(
+            "Price source to use for valuations "
+            "(default: MTG_DECKS_VALUATION_SOURCE or scryfall)"
+        ),
     )
     spares_import.set_defaults(func=cmd_spares_import)
 
@@ -287,28 +367,71 @@ def build_parser() -> argparse.ArgumentParser:
         default="name",
         help="Sort order for the output",
     )
+    spares_search.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="Only show the first N cards in sort order",
+    )
+    spares_search.add_argument(
+        "--no-prices",
+        action="store_true",
+        help="Skip price lookups and omit the value columns (ignored with --sort value)",
+    )
     spares_search.add_argument(
         "--source",
-        default=_APP_CONFIG.valuation_source,
-        help="Price source to use for valuations (default: scryfall)",
+        default=None,
+        help=(
+            "Price source to use for valuations "
+            "(default: MTG_DECKS_VALUATION_SOURCE or scryfall)"
+        ),
     )
     spares_search.set_defaults(func=cmd_spares_search)
 
-    return parser
+
+_SUBCOMMAND_BUILDERS = {
+    "list": _add_list_parser,
+    "show": _add_show_parser,
+    "create": _add_create_parser,
+    "import": _add_import_parser,
+    "value": _add_value_parser,
+    "value-all": _add_value_all_parser,
+    "validate": _add_validate_parser,
+    "spares": _add_spares_parser,
+}
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the subcommand named in ``argv`` if it is a known one."""
+
+    index = 0
+    while index < len(argv):
+        token = argv[index]
+        if token == "--dir":
+            index += 2
+            continue
+        if token.startswith("-"):
+            index += 1
+            continue
+        return token if token in _SUBCOMMAND_BUILDERS else None
+    return None
 
 
 def cmd_list(args: argparse.Namespace) -> int:
+    from .library import DeckLibrary
+
     library = DeckLibrary(args.deck_dir)
     summaries = library.list_summary()
     if not summaries:
-        print(f"No deck files found in {Path(args.deck_dir).resolve()}")
+        print(f"No deck files found in {args.deck_dir.resolve()}")
         return 0
-    for line in summaries:
-        print(line)
+    sys.stdout.write("".join(f"{line}\n" for line in summaries))
     return 0
 
 
 def cmd_show(args: argparse.Namespace) -> int:
+    from .library import DeckLibrary
+
     library = DeckLibrary(args.deck_dir)
     try:
         output = library.show(args.name)
@@ -320,6 +443,8 @@ def cmd_show(args: argparse.Namespace) -> int:
 
 
 def cmd_create(args: argparse.Namespace) -> int:
+    from .library import DeckLibrary
+
     library = DeckLibrary(args.deck_dir)
     try:
         path = library.create_deck(
@@ -339,6 +464,8 @@ def cmd_create(args: argparse.Namespace) -> int:
 
 
 def cmd_import(args: argparse.Namespace) -> int:
+    from .library import DeckLibrary
+
     if not args.card_text and not args.card_file:
         print("Provide --cards or --file with card entries", file=sys.stderr)
         return 2
@@ -348,7 +475,7 @@ def cmd_import(args: argparse.Namespace) -> int:
         if args.card_text:
             card_source = args.card_text
         else:
-            card_source = Path(args.card_file)
+            card_source = args.card_file
 
         library = DeckLibrary(args.deck_dir)
         result = library.import_deck(
@@ -377,6 +504,14 @@ def cmd_import(args: argparse.Namespace) -> int:
 
 
 def cmd_value(args: argparse.Namespace) -> int:
+    """Value a single deck and print its total.
+
+    Card lookups go through the process-wide resolver from ``_resolver_from_source``.
+    """
+
+    from .library import DeckLibrary
+    from .valuation import ValuationCache
+
     library = DeckLibrary(args.deck_dir)
     cache = ValuationCache(args.cache)
     try:
@@ -393,7 +528,7 @@ def cmd_value(args: argparse.Namespace) -> int:
         print(str(exc), file=sys.stderr)
         return 1
 
-    print(f"Total value ({args.currency.upper()}): {valuation.formatted_total()}")
+    print(f"Total value ({args.currency}): {valuation.formatted_total()}")
     if valuation.missing_prices:
         print("Missing prices for:")
         for name in sorted(valuation.missing_prices):
@@ -402,8 +537,16 @@ def cmd_value(args: argparse.Namespace) -> int:
 
 
 def cmd_value_all(args: argparse.Namespace) -> int:
+    """Value every deck and write the valuation report.
+
+    Card lookups go through the process-wide resolver from ``_resolver_from_source``.
+    """
+
+    from .library import DeckLibrary
+    from .valuation import ValuationCache, render_valuation_report
+
     library = DeckLibrary(args.deck_dir)
-    as_of = _dt.datetime.utcnow()
+    as_of = _dt.datetime.now(_dt.timezone.utc)
     cache = ValuationCache(args.cache)
 
     try:
@@ -417,20 +560,27 @@ def cmd_value_all(args: argparse.Namespace) -> int:
         print(str(exc), file=sys.stderr)
         return 1
 
-    for name, valuation in sorted(valuations.items(), key=lambda item: item[0].lower()):
-        print(f"{name}: {valuation.formatted_total()}")
+    sys.stdout.write(
+        "".join(
+            f"{name}: {valuation.formatted_total()}\n"
+            for name, valuation in sorted(valuations.items(), key=lambda item: item[0].lower())
+        )
+    )
 
     if args.report:
         report_text = render_valuation_report(
             valuations, currency=args.currency, as_of=as_of
         )
-        Path(args.report).write_text(report_text, encoding="utf-8")
+        args.report.write_text(report_text, encoding="utf-8")
         print(f"Wrote valuation report to {args.report}")
 
     return 0
 
 
 def cmd_validate(args: argparse.Namespace) -> int:
+    from .library import DeckLibrary
+    from .rules import CommanderRules, ValidationCache
+
     rules = CommanderRules(
         deck_size=args.deck_size,
         expected_format=args.expected_format,
@@ -441,7 +591,8 @@ def cmd_validate(args: argparse.Namespace) -> int:
     )
 
     library = DeckLibrary(args.deck_dir)
-    errors = library.validate_decks(log_path=args.log_path, rules=rules)
+    cache = None if args.no_cache else ValidationCache(args.deck_dir / ".validation-cache.json")
+    errors = library.validate_decks(log_path=args.log_path, rules=rules, cache=cache)
     if errors:
         for line in errors:
             print(line, file=sys.stderr)
@@ -452,6 +603,13 @@ def cmd_validate(args: argparse.Namespace) -> int:
 
 
 def cmd_spares_import(args: argparse.Namespace) -> int:
+    """Resolve card entries and add them to the spares inventory.
+
+    Card lookups go through the process-wide resolver from ``_resolver_from_source``.
+    """
+
+    from .inventory import SparesInventory, build_spare_cards
+
     if not args.card_text and not args.card_file:
         print("Provide --cards or --file with card entries", file=sys.stderr)
         return 2
@@ -460,17 +618,16 @@ def cmd_spares_import(args: argparse.Namespace) -> int:
     if args.card_text:
         card_source = args.card_text
     else:
-        card_source = Path(args.card_file)
+        card_source = args.card_file
 
     inventory = SparesInventory(args.spares_path)
     try:
-        spare_cards = build_spare_cards(
-            card_source, resolver=_resolver_from_source(args.source), box=args.box
-        )
+        resolver = _resolver_from_source(args.source)
+        spare_cards = build_spare_cards(card_source, resolver=resolver, box=args.box)
         entries, missing = inventory.add_cards(
             spare_cards,
             currency=args.currency,
-            resolver=_resolver_from_source(args.source),
+            resolver=resolver,
             sort_by=args.sort,
         )
     except Exception as exc:  # pragma: no cover - user facing
@@ -486,14 +643,25 @@ def cmd_spares_import(args: argparse.Namespace) -> int:
 
 
 def cmd_spares_search(args: argparse.Namespace) -> int:
+    """Search the spares inventory, pricing results when asked.
+
+    Card lookups go through the process-wide resolver from ``_resolver_from_source``.
+    """
+
+    from .inventory import SparesInventory
+    from .valuation import price_formatter
+
     inventory = SparesInventory(args.spares_path)
+    with_prices = not args.no_prices or args.sort == "value"
     try:
         entries, missing = inventory.search(
             currency=args.currency,
-            resolver=_resolver_from_source(args.source),
+            resolver=_resolver_from_source(args.source) if with_prices else None,
             query=args.query,
             boxes=set(args.boxes or []) or None,
             sort_by=args.sort,
+            with_prices=with_prices,
+            limit=args.limit,
         )
     except Exception as exc:  # pragma: no cover - user facing
         print(str(exc), file=sys.stderr)
@@ -503,19 +671,38 @@ def cmd_spares_search(args: argparse.Namespace) -> int:
         print("No spare cards match your filters.")
         return 0
 
-    header = "| Name | Count | Box | CMC | Type | Unit Value | Total Value |"
-    divider = "| --- | --- | --- | --- | --- | --- | --- |"
-    print(header)
-    print(divider)
+    if not with_prices:
+        rows = ["| Name | Count | Box | CMC | Type |\n", "| --- | --- | --- | --- | --- |\n"]
+        for entry, _ in entries:
+            cmc = "" if entry.cmc is None else entry.cmc
+            rows.append(
+                f"| {entry.name} | {entry.count} | {entry.box} | {cmc} | {entry.type_line or ''} |\n"
+            )
+        sys.stdout.write("".join(rows))
+        return 0
+
+    format_price = price_formatter(args.currency)
+    rows = [
+        "| Name | Count | Box | CMC | Type | Unit Value | Total Value |\n",
+        "| --- | --- | --- | --- | --- | --- | --- |\n",
+    ]
     for entry, unit_price in entries:
-        total = (unit_price or 0.0) * entry.count
-        cmc = "" if entry.cmc is None else entry.cmc
-        type_line = entry.type_line or ""
-        unit_value = _format_price(unit_price, currency=args.currency)
-        total_value = _format_price(total if unit_price is not None else None, currency=args.currency)
-        print(
-            f"| {entry.name} | {entry.count} | {entry.box} | {cmc} | {type_line} | {unit_value} | {total_value} |"
+        name, count, box, cmc, type_line = (
+            entry.name,
+            entry.count,
+            entry.box,
+            entry.cmc,
+            entry.type_line,
+        )
+        total = None if unit_price is None else unit_price * count
+        cmc = "" if cmc is None else cmc
+        type_line = type_line or ""
+        unit_value = format_price(unit_price)
+        total_value = format_price(total)
+        rows.append(
+            f"| {name} | {count} | {box} | {cmc} | {type_line} | {unit_value} | {total_value} |\n"
         )
+    sys.stdout.write("".join(rows))
 
     if missing:
         print("\nMissing prices for:")
@@ -525,17 +712,38 @@ def cmd_spares_search(args: argparse.Namespace) -> int:
     return 0
 
 
-def _format_price(value: float | None, *, currency: str) -> str:
-    if value is None:
-        return "Unknown"
-    symbol = {"usd": "$", "eur": "€", "gbp": "£"}.get(currency.lower())
-    formatted = f"{value:,.2f}"
-    return f"{symbol}{formatted}" if symbol else f"{currency.upper()} {formatted}"
+def _fast_path_args(argv: list[str]) -> argparse.Namespace | None:
+    """Parse the plain ``list``/``show NAME`` shapes without building the parser.
+
+    Anything else, including flags on the subcommand, returns ``None`` so the
+    full argparse path stays authoritative.
+    """
+
+    deck_dir = Path("decks")
+    if len(argv) >= 2 and argv[0] == "--dir" and not argv[1].startswith("-"):
+        deck_dir, argv = Path(argv[1]), argv[2:]
+    if argv == ["list"]:
+        return argparse.Namespace(deck_dir=deck_dir, command="list", func=cmd_list)
+    if len(argv) == 2 and argv[0] == "show" and not argv[1].startswith("-"):
+        return argparse.Namespace(deck_dir=deck_dir, command="show", name=argv[1], func=cmd_show)
+    return None
 
 
 def main(argv: list[str] | None = None) -> int:
-    parser = build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] in _VERSION_FLAGS:
+        # Mirror argparse's version action without building the parser.
+        print(__version__)
+        raise SystemExit(0)
+
+    args = _fast_path_args(argv)
+    if args is not None:
+        return args.func(args)
+
+    parser = build_parser(_sniff_subcommand(argv))
     args = parser.parse_args(argv)
+    _apply_config_defaults(args)
     return args.func(args)
 
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass
 from pathlib import Path
@@ -12,20 +13,23 @@ def _load_env_file(path: Path) -> None:
     clobbering explicit runtime configuration.
     """
 
-    if not path.exists():
+    try:
+        handle = path.open("r", encoding="utf-8")
+    except FileNotFoundError:
         return
 
-    for line in path.read_text(encoding="utf-8").splitlines():
-        trimmed = line.strip()
-        if not trimmed or trimmed.startswith("#"):
-            continue
-        if "=" not in trimmed:
-            continue
-        key, value = trimmed.split("=", 1)
-        os.environ.setdefault(key.strip(), value.strip())
+    with handle:
+        for line in handle:
+            trimmed = line.strip()
+            if not trimmed or trimmed.startswith("#"):
+                continue
+            key, separator, value = trimmed.partition("=")
+            if not separator:
+                continue
+            os.environ.setdefault(key.strip(), value.strip())
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Container for runtime configuration values."""
 
@@ -33,14 +37,17 @@ class AppConfig:
     valuation_source: str
     valuation_cache_path: Path
     env_path: Path | None = None
+    card_cache_path: Path = Path("card-cache.json")
 
 
+@functools.lru_cache(maxsize=4)
 def load_config(env_path: str | Path | None = ".env") -> AppConfig:
     """Load configuration from the environment or a .env file.
 
     Environment variables take precedence over .env entries and sensible
     defaults are provided for all fields so the CLI can function without any
-    configuration present.
+    configuration present. Results are cached per ``env_path`` for the life of
+    the process; call ``load_config.cache_clear()`` to pick up changes.
     """
 
     env_file = Path(env_path) if env_path is not None else None
@@ -50,11 +57,13 @@ def load_config(env_path: str | Path | None = ".env") -> AppConfig:
     default_currency = os.getenv("MTG_DECKS_CURRENCY", "GBP")
     valuation_source = os.getenv("MTG_DECKS_VALUATION_SOURCE", "scryfall")
     valuation_cache = os.getenv("MTG_DECKS_VALUATION_CACHE", "valuation-cache.json")
+    card_cache = os.getenv("MTG_DECKS_CARD_CACHE", "card-cache.json")
 
     return AppConfig(
         default_currency=default_currency,
         valuation_source=valuation_source,
         valuation_cache_path=Path(valuation_cache),
         env_path=env_file,
+        card_cache_path=Path(card_cache),
     )
 
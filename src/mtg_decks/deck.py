@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import asdict, dataclass, field
+import functools
 from pathlib import Path
+import sys
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Deck:
     """Representation of a Commander deck stored as a Markdown file."""
 
@@ -27,61 +29,58 @@ class Deck:
         body_template: str | None = None,
         decklist_lines: list[str] | None = None,
     ) -> str:
-        front_matter = [self.FRONT_MATTER_MARK]
-        front_matter.append(f"name: {self.name}")
-        front_matter.append(f"commander: {self.commander}")
-        if self.colors:
-            front_matter.append(f"colors: {', '.join(self.colors)}")
-        if self.theme:
-            front_matter.append(f"theme: {self.theme}")
-        if self.format:
-            front_matter.append(f"format: {self.format}")
-        if self.created:
-            front_matter.append(f"created: {self.created}")
-        if self.updated:
-            front_matter.append(f"updated: {self.updated}")
-        if self.notes:
-            front_matter.append(f"notes: {self.notes}")
-        front_matter.append(self.FRONT_MATTER_MARK)
-
-        body = _build_body(self, body_template, decklist_lines=decklist_lines)
-
-        return "\n".join(front_matter + ["\n"] + body) + "\n"
+        mark = self.FRONT_MATTER_MARK
+        colors_line = f"colors: {', '.join(self.colors)}\n" if self.colors else ""
+        theme_line = f"theme: {self.theme}\n" if self.theme else ""
+        format_line = f"format: {self.format}\n" if self.format else ""
+        created_line = f"created: {self.created}\n" if self.created else ""
+        updated_line = f"updated: {self.updated}\n" if self.updated else ""
+        notes_line = f"notes: {self.notes}\n" if self.notes else ""
+
+        body = "\n".join(_build_body(self, body_template, decklist_lines=decklist_lines))
+
+        return (
+            f"{mark}\nname: {self.name}\ncommander: {self.commander}\n"
+            f"{colors_line}{theme_line}{format_line}{created_line}{updated_line}{notes_line}"
+            f"{mark}\n\n\n{body}\n"
+        )
 
     @classmethod
     def from_file(cls, path: Path) -> "Deck":
-        lines = path.read_text(encoding="utf-8").splitlines()
         metadata: dict[str, str] = {}
 
-        if lines and lines[0].strip() == cls.FRONT_MATTER_MARK:
-            closing_idx = None
-            for idx in range(1, len(lines)):
-                line = lines[idx].strip()
-                if line == cls.FRONT_MATTER_MARK:
-                    closing_idx = idx
-                    break
-                if not line:
-                    continue
-                if ":" not in line:
-                    raise ValueError(
-                        f"Invalid front matter line in {path}: '{lines[idx]}'"
-                    )
-                key, value = line.split(":", 1)
-                metadata[key.strip()] = value.strip()
-            if closing_idx is None:
-                raise ValueError(f"Front matter not terminated in {path}")
-
-        if lines and lines[0].strip() == cls.FRONT_MATTER_MARK and "commander" not in metadata:
+        # Only the front matter is needed, so stop reading at its closing mark.
+        with path.open("r", encoding="utf-8") as handle:
+            has_front_matter = handle.readline().strip() == cls.FRONT_MATTER_MARK
+            if has_front_matter:
+                for raw_line in handle:
+                    line = raw_line.strip()
+                    if line == cls.FRONT_MATTER_MARK:
+                        break
+                    if not line:
+                        continue
+                    key, separator, value = line.partition(":")
+                    if not separator:
+                        original = raw_line.rstrip("\n")
+                        raise ValueError(f"Invalid front matter line in {path}: '{original}'")
+                    metadata[key.strip()] = value.strip()
+                else:
+                    raise ValueError(f"Front matter not terminated in {path}")
+
+        if has_front_matter and "commander" not in metadata:
             raise ValueError(f"Front matter missing required field 'commander' in {path}")
 
         name = metadata.get("name") or path.stem.replace("-", " ")
         commander = metadata.get("commander", "Unknown")
-        colors = _split_csv(metadata.get("colors", ""))
+        # Colors, theme and format repeat across a library; share one string each.
+        colors = [sys.intern(color) for color in _split_csv(metadata.get("colors", ""))]
         theme = metadata.get("theme")
+        if theme is not None:
+            theme = sys.intern(theme)
         created = metadata.get("created")
         updated = metadata.get("updated")
         notes = metadata.get("notes")
-        deck_format = metadata.get("format", "Commander")
+        deck_format = sys.intern(metadata.get("format", "Commander"))
 
         return cls(
             name=name,
@@ -146,6 +145,7 @@ class _DeckTemplateDefaults(dict):
         return ""
 
 
+@functools.lru_cache(maxsize=1024)
 def slugify(text: str) -> str:
     """Create a file-system friendly slug."""
 
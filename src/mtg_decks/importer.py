@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import atexit
 import csv
+import datetime as _dt
 import io
 import json
+import os
+import threading
+import time
 import urllib.parse
-import urllib.request
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import date
 from pathlib import Path
 from typing import Iterable
@@ -14,7 +18,7 @@ from .deck import Deck, slugify
 from .rules import CommanderRules, load_decklist
 
 
-@dataclass
+@dataclass(slots=True)
 class CardData:
     """Basic information returned from a card lookup."""
 
@@ -31,31 +35,263 @@ class CardResolver:
     def resolve(self, query: str) -> CardData | None:  # pragma: no cover - interface
         raise NotImplementedError
 
+    def resolve_many(self, queries: Iterable[str]) -> dict[str, CardData | None]:
+        """Resolve several queries, keyed by the original query text."""
+
+        results: dict[str, CardData | None] = {}
+        for query in queries:
+            if query not in results:
+                results[query] = self.resolve(query)
+        return results
+
+
+class CardCache:
+    """Persist resolved card data between runs so repeat lookups skip the network."""
+
+    def __init__(self, path: str | Path, *, ttl: _dt.timedelta = _dt.timedelta(hours=24)):
+        self.path = Path(path)
+        self.ttl = ttl
+        self._data: dict[str, dict] = {}
+        self._loaded = False
+        self._dirty = False
+        self._save_registered = False
+        # Deck validation and fuzzy lookups share one cache across threads.
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            # A damaged or foreign file is treated as an empty cache rather than an error.
+            self._data = data if isinstance(data, dict) else {}
+            self._loaded = True
+
+    def get(self, key: str, *, now: _dt.datetime | None = None) -> CardData | None:
+        self.load()
+        entry = self._data.get(key)
+        if not entry:
+            return None
+        try:
+            fetched_at = _dt.datetime.fromisoformat(entry["fetched_at"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if fetched_at.tzinfo is None:
+            fetched_at = fetched_at.replace(tzinfo=_dt.timezone.utc)
+        current_time = now or _dt.datetime.now(_dt.timezone.utc)
+        if current_time.tzinfo is None:
+            current_time = current_time.replace(tzinfo=_dt.timezone.utc)
+        if current_time - fetched_at > self.ttl:
+            return None
+        try:
+            return CardData(**entry["card"])
+        except (AttributeError, KeyError, TypeError):
+            # Entries written by an older or newer schema are simply looked up again.
+            return None
+
+    def store(self, key: str, card: CardData, *, now: _dt.datetime | None = None) -> None:
+        self.load()
+        fetched_at = now or _dt.datetime.now(_dt.timezone.utc)
+        entry = {"fetched_at": fetched_at.isoformat(), "card": asdict(card)}
+        with self._lock:
+            self._data[key] = entry
+            self._dirty = True
+            if not self._save_registered:
+                atexit.register(self.save)
+                self._save_registered = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            staging_path = self.path.with_name(f"{self.path.name}.tmp")
+            staging_path.write_text(json.dumps(self._data), encoding="utf-8")
+            os.replace(staging_path, self.path)
+            self._dirty = False
+
 
 class ScryfallResolver(CardResolver):
     """Resolve card names using Scryfall's fuzzy matching API."""
 
-    def __init__(self, base_url: str = "https://api.scryfall.com") -> None:
+    COLLECTION_BATCH_SIZE = 75
+    # Scryfall asks clients to leave 50-100ms between requests.
+    MIN_REQUEST_INTERVAL = 0.1
+    MAX_FUZZY_WORKERS = 10
+    REQUEST_HEADERS = {"User-Agent": "mtg-decks", "Accept": "application/json"}
+
+    def __init__(
+        self, base_url: str = "https://api.scryfall.com", *, cache: CardCache | None = None
+    ) -> None:
         self.base_url = base_url.rstrip("/")
+        self.cache = cache
+        self._resolved: dict[str, CardData] = {}
+        self._throttle_lock = threading.Lock()
+        self._last_request = 0.0
+        self._base_path = urllib.parse.urlsplit(self.base_url).path
+        self._local = threading.local()
+
+    def _wait_for_request_slot(self) -> None:
+        with self._throttle_lock:
+            delay = self._last_request + self.MIN_REQUEST_INTERVAL - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._last_request = time.monotonic()
+
+    def _lookup(self, key: str) -> CardData | None:
+        card = self._resolved.get(key)
+        if card is None and self.cache is not None:
+            card = self.cache.get(key)
+            if card is not None:
+                self._resolved[key] = card
+        return card
+
+    def _remember(self, key: str, card: CardData) -> None:
+        self._resolved[key] = card
+        if self.cache is not None:
+            self.cache.store(key, card)
 
     def resolve(self, query: str) -> CardData | None:
-        url = f"{self.base_url}/cards/named?fuzzy={urllib.parse.quote(query)}"
-        try:
-            with urllib.request.urlopen(url, timeout=10) as response:
-                payload = json.loads(response.read().decode("utf-8"))
-        except Exception:
+        key = query.strip().casefold()
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        card = self._fetch(query)
+        # Failed lookups are not remembered so a transient error can be retried.
+        if card is not None:
+            self._remember(key, card)
+        return card
+
+    def resolve_many(self, queries: Iterable[str]) -> dict[str, CardData | None]:
+        """Resolve queries with batched exact-name lookups.
+
+        Names are sent to ``/cards/collection`` in batches of up to 75. Anything
+        the collection endpoint cannot match exactly falls back to the fuzzy
+        ``resolve`` lookup.
+        """
+
+        results: dict[str, CardData | None] = {}
+        pending: list[str] = []
+        for query in queries:
+            if query in results:
+                continue
+            results[query] = self._lookup(query.strip().casefold())
+            if results[query] is None:
+                pending.append(query)
+
+        unmatched: list[str] = []
+        for start in range(0, len(pending), self.COLLECTION_BATCH_SIZE):
+            batch = pending[start : start + self.COLLECTION_BATCH_SIZE]
+            found = self._fetch_collection(batch)
+            for query in batch:
+                key = query.strip().casefold()
+                card = found.get(key)
+                if card is None:
+                    unmatched.append(query)
+                    continue
+                self._remember(key, card)
+                results[query] = card
+
+        if len(unmatched) > 1:
+            # Fuzzy lookups are one request each; overlap their network waits.
+            from concurrent.futures import ThreadPoolExecutor  # deferred: only batch lookups need it
+
+            workers = min(self.MAX_FUZZY_WORKERS, len(unmatched))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results.update(zip(unmatched, executor.map(self.resolve, unmatched)))
+        elif unmatched:
+            results[unmatched[0]] = self.resolve(unmatched[0])
+        return results
+
+    def _fetch_collection(self, queries: list[str]) -> dict[str, CardData]:
+        """Return exact-name matches for ``queries`` keyed by casefolded name."""
+
+        body = json.dumps({"identifiers": [{"name": query.strip()} for query in queries]})
+        payload = self._request_json("POST", "/cards/collection", body=body.encode("utf-8"))
+        if payload is None:
+            return {}
+
+        found: dict[str, CardData] = {}
+        for entry in payload.get("data") or []:
+            card = _card_from_payload(entry, entry.get("name", ""))
+            found[card.name.casefold()] = card
+            # Double-faced cards come back as "Front // Back"; match the front too.
+            front, separator, _ = card.name.partition(" // ")
+            if separator:
+                found.setdefault(front.casefold(), card)
+        return found
+
+    def _fetch(self, query: str) -> CardData | None:
+        payload = self._request_json("GET", f"/cards/named?fuzzy={urllib.parse.quote(query)}")
+        if payload is None:
             return None
+        return _card_from_payload(payload, query)
+
+    def _connection(self):
+        """Return this thread's keep-alive connection to the API host."""
+
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            import http.client  # deferred: pulls in the email package
 
-        return CardData(
-            name=payload.get("name", query),
-            type_line=payload.get("type_line"),
-            color_identity=payload.get("color_identity") or payload.get("colors"),
-            cmc=payload.get("cmc"),
-            prices=payload.get("prices"),
-        )
+            parts = urllib.parse.urlsplit(self.base_url)
+            if parts.scheme == "http":
+                connection = http.client.HTTPConnection(parts.netloc, timeout=10)
+            else:
+                connection = http.client.HTTPSConnection(parts.netloc, timeout=10)
+            self._local.connection = connection
+        return connection
+
+    def _request_json(self, method: str, path: str, *, body: bytes | None = None) -> dict | None:
+        """Send a request over a reused connection and decode the JSON reply.
+
+        Returns ``None`` for error statuses or network failures. A connection the
+        server has already closed is replaced and the request retried once.
+        """
+
+        headers = dict(self.REQUEST_HEADERS)
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+
+        self._wait_for_request_slot()
+        for attempt in range(2):
+            connection = self._connection()
+            try:
+                connection.request(method, f"{self._base_path}{path}", body=body, headers=headers)
+                response = connection.getresponse()
+                data = response.read()
+            except Exception:
+                connection.close()
+                self._local.connection = None
+                if attempt:
+                    return None
+                continue
+            if response.status >= 400:
+                return None
+            try:
+                return json.loads(data)
+            except ValueError:
+                return None
+        return None  # pragma: no cover - loop always returns
+
+
+def _card_from_payload(payload: dict, query: str) -> CardData:
+    return CardData(
+        name=payload.get("name", query),
+        type_line=payload.get("type_line"),
+        color_identity=payload.get("color_identity") or payload.get("colors"),
+        cmc=payload.get("cmc"),
+        prices=payload.get("prices"),
+    )
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportResult:
     path: Path
     warnings: list[str]
@@ -66,6 +302,10 @@ class ImportResult:
 def parse_import_rows(text: str) -> list[tuple[int, str]]:
     """Parse newline or CSV-based input into (count, card_name) tuples."""
 
+    if "," not in text and '"' not in text:
+        # Plain "2 Sol Ring" lines never need the CSV state machine.
+        return [_parse_line(line.strip()) for line in text.split("\n") if line.strip()]
+
     rows: list[tuple[int, str]] = []
     reader = csv.reader(io.StringIO(text))
     for row in reader:
@@ -85,12 +325,8 @@ def parse_import_rows(text: str) -> list[tuple[int, str]]:
                 line = ",".join(row).strip()
                 count_text, name = "1", line
         else:
-            line = row[0].strip()
-            parts = line.split(maxsplit=1)
-            if len(parts) == 2 and _looks_like_count(parts[0]):
-                count_text, name = parts[0], parts[1]
-            else:
-                count_text, name = "1", line
+            rows.append(_parse_line(row[0].strip()))
+            continue
 
         count = _parse_count(count_text)
         rows.append((count, name))
@@ -98,6 +334,15 @@ def parse_import_rows(text: str) -> list[tuple[int, str]]:
     return rows
 
 
+def _parse_line(line: str) -> tuple[int, str]:
+    """Parse a single ``COUNT NAME`` (or bare ``NAME``) line."""
+
+    parts = line.split(maxsplit=1)
+    if len(parts) == 2 and _looks_like_count(parts[0]):
+        return _parse_count(parts[0]), parts[1]
+    return 1, line
+
+
 def _parse_count(text: str) -> int:
     """Convert text to an integer card count, handling common suffixes."""
 
@@ -164,7 +409,7 @@ def import_deck(
     """Import a deck from free-form card input or CSV and write it to disk."""
 
     if isinstance(card_source, Path):
-        card_text = Path(card_source).read_text(encoding="utf-8")
+        card_text = card_source.read_text(encoding="utf-8")
     else:
         card_text = card_source
 
@@ -175,7 +420,17 @@ def import_deck(
     resolver = resolver or ScryfallResolver()
     warnings: list[str] = []
 
-    resolved_commander = resolver.resolve(commander)
+    # Look up each card once, even when the commander is repeated in the list or
+    # a name appears with different capitalisation.
+    query_for_key: dict[str, str] = {}
+    for name in (commander, *(name for _, name in entries)):
+        query_for_key.setdefault(name.strip().casefold(), name)
+    resolved_by_query = resolver.resolve_many(query_for_key.values())
+
+    def resolved_for(name: str) -> CardData | None:
+        return resolved_by_query[query_for_key[name.strip().casefold()]]
+
+    resolved_commander = resolved_for(commander)
     commander_name = (resolved_commander.name if resolved_commander else commander).strip()
     if commander_name.casefold() != commander.casefold():
         warnings.append(f"Commander resolved as '{commander_name}' (input: '{commander}')")
@@ -186,29 +441,31 @@ def import_deck(
     if not deck_colors and resolved_commander and resolved_commander.color_identity:
         deck_colors = list(resolved_commander.color_identity)
 
-    normalized_cards: list[tuple[int, str]] = []
+    normalized_cards: list[tuple[int, str, str]] = []
     for count, name in entries:
-        resolved = resolver.resolve(name)
+        resolved = resolved_for(name)
         normalized = (resolved.name if resolved else name).strip()
+        normalized_fold = normalized.casefold()
         if resolved is None:
             warnings.append(f"Using '{name}' as-is (lookup failed)")
-        elif normalized.casefold() != name.casefold():
+        elif normalized_fold != name.casefold():
             warnings.append(f"Resolved '{name}' to '{normalized}'")
-        normalized_cards.append((count, normalized))
+        normalized_cards.append((count, normalized, normalized_fold))
 
     # Remove explicit commander entries from the imported list to prevent doubles.
+    commander_fold = commander_name.casefold()
     filtered_cards: list[tuple[int, str]] = []
-    for count, name in normalized_cards:
-        if name.casefold() == commander_name.casefold():
+    for count, name, name_fold in normalized_cards:
+        if name_fold == commander_fold:
             if count > 1:
                 warnings.append("Commander provided multiple times; keeping a single copy")
             continue
         filtered_cards.append((count, name))
 
     decklist_lines = [f"- [Commander] {commander_name}"]
-    for count, name in filtered_cards:
-        prefix = f"{count}x " if count > 1 else ""
-        decklist_lines.append(f"- {prefix}{name}")
+    decklist_lines.extend(
+        f"- {count}x {name}" if count > 1 else f"- {name}" for count, name in filtered_cards
+    )
 
     deck = Deck(
         name=deck_name,
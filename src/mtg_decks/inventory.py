@@ -1,15 +1,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import heapq
+from itertools import chain, islice
 import math
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Callable, Iterable
 
 from .importer import CardResolver, ScryfallResolver, parse_import_rows
-from .valuation import DeckValuer
+from .valuation import DeckValuer, price_formatter
 
 
-@dataclass
+# A Markdown table separator row is made only of these characters.
+_DELIMITER_ROW_CHARS = "|-: \t"
+
+
+@dataclass(slots=True)
 class SpareCard:
     name: str
     count: int
@@ -40,11 +46,11 @@ class SparesInventory:
             stripped = line.strip()
             if not stripped.startswith("|"):
                 continue
-            if set(stripped.replace("|", "").strip()) <= {"-", " ", ":"}:
+            if not stripped.strip(_DELIMITER_ROW_CHARS):
                 continue
 
             cells = [cell.strip() for cell in stripped.strip("|").split("|")]
-            if not cells or cells[0].lower() == "name":
+            if cells[0].lower() == "name":
                 continue
 
             name = cells[0]
@@ -66,7 +72,7 @@ class SparesInventory:
         sort_by: str = "name",
     ) -> tuple[list[tuple[SpareCard, float | None]], list[str]]:
         existing = self.load()
-        merged = _merge_cards(existing, list(new_cards))
+        merged = _merge_cards(existing, new_cards)
         priced, missing = _price_cards(merged, currency=currency, resolver=resolver)
         sorted_entries = _sort_cards(priced, key=sort_by)
         self._write(sorted_entries, currency=currency)
@@ -80,7 +86,17 @@ class SparesInventory:
         query: str | None = None,
         boxes: set[str] | None = None,
         sort_by: str = "name",
+        with_prices: bool = True,
+        limit: int | None = None,
     ) -> tuple[list[tuple[SpareCard, float | None]], list[str]]:
+        """Filter the inventory and return ``(entry, unit_price)`` pairs.
+
+        Passing ``with_prices=False`` skips every price lookup and pairs each
+        entry with ``None``; sorting by value always needs prices, so it ignores
+        the flag. ``limit`` keeps only the first entries in sort order, and for
+        name or mana value sorts only those entries are priced.
+        """
+
         entries = self.load()
         if query:
             query_lower = query.casefold()
@@ -95,32 +111,39 @@ class SparesInventory:
         if boxes:
             entries = [entry for entry in entries if entry.box in boxes]
 
-        priced, missing = _price_cards(entries, currency=currency, resolver=resolver)
-        priced = _sort_cards(priced, key=sort_by)
+        by_value = sort_by.lower() == "value"
+        if limit is not None and not by_value:
+            top = _sort_cards([(entry, None) for entry in entries], key=sort_by, limit=limit)
+            entries = [entry for entry, _ in top]
+
+        if with_prices or by_value:
+            priced, missing = _price_cards(entries, currency=currency, resolver=resolver)
+        else:
+            priced, missing = [(entry, None) for entry in entries], []
+        priced = _sort_cards(priced, key=sort_by, limit=limit)
         return priced, missing
 
     def _write(self, entries: list[tuple[SpareCard, float | None]], *, currency: str) -> None:
-        lines = ["# Spare Card Inventory", ""]
-        lines.append(f"Currency: {currency.upper()}")
-        lines.append("")
-        lines.append("| Name | Count | Box | CMC | Type | Unit Value | Total Value |")
-        lines.append("| --- | --- | --- | --- | --- | --- | --- |")
+        format_price = price_formatter(currency)
+        lines = [
+            "# Spare Card Inventory",
+            "",
+            f"Currency: {currency.upper()}",
+            "",
+            "| Name | Count | Box | CMC | Type | Unit Value | Total Value |",
+            "| --- | --- | --- | --- | --- | --- | --- |",
+        ]
 
         for entry, unit_price in entries:
-            total = (unit_price or 0.0) * entry.count
+            cmc = "" if entry.cmc is None else _trim_trailing_zero(entry.cmc)
+            total = None if unit_price is None else unit_price * entry.count
             lines.append(
-                "| {name} | {count} | {box} | {cmc} | {type_line} | {unit_value} | {total_value} |".format(
-                    name=entry.name,
-                    count=entry.count,
-                    box=entry.box,
-                    cmc="" if entry.cmc is None else _trim_trailing_zero(entry.cmc),
-                    type_line=entry.type_line or "",
-                    unit_value=_format_currency(unit_price, currency=currency),
-                    total_value=_format_currency(total if unit_price is not None else None, currency=currency),
-                )
+                f"| {entry.name} | {entry.count} | {entry.box} | {cmc} | {entry.type_line or ''} "
+                f"| {format_price(unit_price)} | {format_price(total)} |"
             )
 
-        self.path.write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
+        lines.append("")
+        self.path.write_text("\n".join(lines), encoding="utf-8")
 
 
 def build_spare_cards(
@@ -130,7 +153,7 @@ def build_spare_cards(
     box: str,
 ) -> list[SpareCard]:
     if isinstance(card_source, Path):
-        card_text = Path(card_source).read_text(encoding="utf-8")
+        card_text = card_source.read_text(encoding="utf-8")
     else:
         card_text = card_source
 
@@ -156,11 +179,12 @@ def build_spare_cards(
     return results
 
 
-def _merge_cards(existing: list[SpareCard], new_cards: list[SpareCard]) -> list[SpareCard]:
+def _merge_cards(existing: list[SpareCard], new_cards: Iterable[SpareCard]) -> list[SpareCard]:
     by_key: dict[tuple[str, str], SpareCard] = {}
-    for card in existing + new_cards:
+    for card in chain(existing, new_cards):
         key = (card.name.casefold(), card.box)
-        if key not in by_key:
+        current = by_key.get(key)
+        if current is None:
             by_key[key] = SpareCard(
                 name=card.name,
                 count=card.count,
@@ -169,7 +193,7 @@ def _merge_cards(existing: list[SpareCard], new_cards: list[SpareCard]) -> list[
                 type_line=card.type_line,
             )
         else:
-            by_key[key].merge(card)
+            current.merge(card)
     return list(by_key.values())
 
 
@@ -180,8 +204,12 @@ def _price_cards(
     priced: list[tuple[SpareCard, float | None]] = []
     missing: list[str] = []
 
+    # The same card can sit in several boxes; price each name once.
+    query_for_key = {entry.name.casefold(): entry.name for entry in entries}
+    prices = valuer.price_cards(query_for_key.values(), currency=currency)
+
     for entry in entries:
-        unit_price = valuer.price_card(entry.name, currency=currency)
+        unit_price = prices[query_for_key[entry.name.casefold()]]
         if unit_price is None:
             missing.append(entry.name)
         priced.append((entry, unit_price))
@@ -190,26 +218,43 @@ def _price_cards(
 
 
 def _sort_cards(
-    entries: list[tuple[SpareCard, float | None]], *, key: str
+    entries: list[tuple[SpareCard, float | None]], *, key: str, limit: int | None = None
 ) -> list[tuple[SpareCard, float | None]]:
+    """Order priced entries by ``key``, keeping only the first ``limit`` when set.
+
+    With a limit the top entries are selected with a heap instead of sorting
+    the whole list; ties keep their input order either way.
+    """
+
     key = key.lower()
 
     if key == "value":
-        return sorted(
-            entries,
-            key=lambda item: ((item[1] or 0.0) * item[0].count) * -1,
-        )
+        return _ordered(entries, lambda item: -(item[1] or 0.0) * item[0].count, limit)
     if key == "cmc":
-        return sorted(entries, key=lambda item: (item[0].cmc is None, item[0].cmc or 0))
-    return sorted(entries, key=lambda item: item[0].name.casefold())
+        # Sort known mana values directly and append the unknowns, which keeps
+        # both groups stable without building a tuple key per entry.
+        known = _ordered(
+            [item for item in entries if item[0].cmc is not None],
+            lambda item: item[0].cmc,
+            limit,
+        )
+        unknown = (item for item in entries if item[0].cmc is None)
+        if limit is None:
+            known.extend(unknown)
+        else:
+            known.extend(islice(unknown, max(limit - len(known), 0)))
+        return known
+    return _ordered(entries, lambda item: item[0].name.casefold(), limit)
 
 
-def _format_currency(value: float | None, *, currency: str) -> str:
-    if value is None:
-        return "Unknown"
-    symbol = {"usd": "$", "eur": "€", "gbp": "£"}.get(currency.lower())
-    formatted = f"{value:,.2f}"
-    return f"{symbol}{formatted}" if symbol else f"{currency.upper()} {formatted}"
+def _ordered(
+    items: list[tuple[SpareCard, float | None]],
+    sort_key: Callable[[tuple[SpareCard, float | None]], Any],
+    limit: int | None,
+) -> list[tuple[SpareCard, float | None]]:
+    if limit is None:
+        return sorted(items, key=sort_key)
+    return heapq.nsmallest(limit, items, key=sort_key)
 
 
 def _safe_int(value: str) -> int:
@@ -1,18 +1,66 @@
 from __future__ import annotations
 
+import dataclasses
 import datetime as _dt
+import functools
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable, TypeVar
 
 from .deck import Deck, slugify
 from .importer import import_deck as import_deck_from_source
-from .rules import load_decklist
+from .rules import DeckCounts, ValidationCache, load_decklist, rules_fingerprint
 from .valuation import DeckValuation, DeckValuer
 
 
 logger = logging.getLogger(__name__)
 
+MAX_DECK_WORKERS = 16
+
+T = TypeVar("T")
+
+
+@functools.lru_cache(maxsize=512)
+def _load_deck_cached(path_str: str, mtime_ns: int, size: int) -> Deck:
+    return Deck.from_file(Path(path_str))
+
+
+@functools.lru_cache(maxsize=512)
+def _load_decklist_cached(path_str: str, mtime_ns: int, size: int) -> tuple[DeckCounts, set[str]]:
+    return load_decklist(Path(path_str))
+
+
+def _load_deck(path: Path, stat: os.stat_result | None = None) -> Deck:
+    """Parse ``path``, reusing the previous result while the file is unchanged.
+
+    Callers get their own copy so mutating it cannot leak into the memo.
+    """
+
+    if stat is None:
+        stat = path.stat()
+    deck = _load_deck_cached(str(path), stat.st_mtime_ns, stat.st_size)
+    return dataclasses.replace(deck, colors=list(deck.colors))
+
+
+def _load_decklist(path: Path, stat: os.stat_result | None = None) -> tuple[DeckCounts, set[str]]:
+    """Parse the decklist section of ``path`` with the same reuse rules as ``_load_deck``."""
+
+    if stat is None:
+        stat = path.stat()
+    counts, commanders = _load_decklist_cached(str(path), stat.st_mtime_ns, stat.st_size)
+    return dict(counts), set(commanders)
+
+
+def _map_decks(func: Callable[[Path], T], paths: list[Path]) -> list[T]:
+    """Apply ``func`` to each deck path on a thread pool, keeping input order."""
+
+    if len(paths) < 2:
+        return [func(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(MAX_DECK_WORKERS, len(paths))) as executor:
+        return list(executor.map(func, paths))
+
 
 class DeckLibrary:
     """Manage a directory of Commander decks stored as Markdown files."""
@@ -25,7 +73,7 @@ class DeckLibrary:
         return sorted(self.root.glob("*.md"))
 
     def load_decks(self) -> list[Deck]:
-        return [Deck.from_file(path) for path in self.deck_files()]
+        return [_load_deck(path) for path in self.deck_files()]
 
     def list_summary(self) -> list[str]:
         summaries = []
@@ -40,32 +88,43 @@ class DeckLibrary:
         *,
         log_path: str | Path | None = None,
         rules=None,
+        cache: ValidationCache | None = None,
     ) -> list[str]:
         """Validate deck files and optionally write a log of any errors.
 
         The log file is overwritten on each invocation so callers do not need
-        to manually clear previous results.
+        to manually clear previous results. When ``cache`` is provided, decks
+        whose files are unchanged since the last run under the same rules reuse
+        their previous results.
         """
 
+        if cache is not None:
+            cache.use_rules(rules_fingerprint(rules))
+
+        def check(path: Path) -> tuple[object, list[str], bool]:
+            stat = None
+            if cache is not None:
+                try:
+                    stat = path.stat()
+                except OSError as exc:
+                    # Report a deck that vanished mid-run like any other invalid deck.
+                    return None, [f"{path}: {exc}"], False
+            cached = cache.get(path, stat) if cache is not None else None
+            if cached is not None:
+                return stat, cached, False
+            return stat, self._validate_deck_file(path, rules), True
+
+        paths = self.deck_files()
         errors: list[str] = []
-        for path in self.deck_files():
-            try:
-                deck = Deck.from_file(path)
-                if not deck.name:
-                    raise ValueError("Deck name is required")
-                if not deck.commander:
-                    raise ValueError("Commander is required")
-
-                if rules is not None:
-                    card_counts, commander_entries = load_decklist(path)
-                    for issue in rules.validate(deck, card_counts, commander_entries):
-                        message = f"{path}: {issue}"
-                        errors.append(message)
-                        logger.error(message)
-            except Exception as exc:
-                message = f"{path}: {exc}"
-                errors.append(message)
+        for path, (stat, deck_errors, fresh) in zip(paths, _map_decks(check, paths)):
+            if fresh and cache is not None:
+                cache.store(path, stat, deck_errors)
+            for message in deck_errors:
                 logger.error(message)
+            errors.extend(deck_errors)
+
+        if cache is not None:
+            cache.save()
 
         if log_path is not None:
             Path(log_path).write_text(
@@ -74,6 +133,24 @@ class DeckLibrary:
 
         return errors
 
+    def _validate_deck_file(self, path: Path, rules) -> list[str]:
+        errors: list[str] = []
+        try:
+            stat = path.stat()
+            deck = _load_deck(path, stat)
+            if not deck.name:
+                raise ValueError("Deck name is required")
+            if not deck.commander:
+                raise ValueError("Commander is required")
+
+            if rules is not None:
+                card_counts, commander_entries = _load_decklist(path, stat)
+                for issue in rules.validate(deck, card_counts, commander_entries):
+                    errors.append(f"{path}: {issue}")
+        except Exception as exc:
+            errors.append(f"{path}: {exc}")
+        return errors
+
     def create_deck(
         self,
         name: str,
@@ -114,9 +191,10 @@ class DeckLibrary:
     def read_deck(self, name_or_slug: str) -> Deck:
         slug = slugify(name_or_slug)
         path = self.root / f"{slug}.md"
-        if not path.exists():
-            raise FileNotFoundError(f"Deck not found: {path}")
-        return Deck.from_file(path)
+        try:
+            return _load_deck(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Deck not found: {path}") from None
 
     def import_deck(
         self,
@@ -163,13 +241,13 @@ class DeckLibrary:
         if deck.path is None:
             raise FileNotFoundError("Deck is missing a path to load card entries")
 
-        current_time = now or _dt.datetime.utcnow()
+        current_time = now or _dt.datetime.now(_dt.timezone.utc)
         if cache is not None:
             cached = cache.get(deck.name, currency=currency, now=current_time)
             if cached is not None:
                 return cached
 
-        card_counts, _ = load_decklist(deck.path)
+        card_counts, _ = _load_decklist(deck.path)
         valuer = DeckValuer(resolver=resolver)
         valuation = valuer.value_counts(card_counts, currency=currency)
 
@@ -195,23 +273,23 @@ class DeckLibrary:
 
         valuer = DeckValuer(resolver=resolver)
         results: dict[str, DeckValuation] = {}
-        current_time = now or _dt.datetime.utcnow()
-
-        for path in self.deck_files():
-            deck = Deck.from_file(path)
+        current_time = now or _dt.datetime.now(_dt.timezone.utc)
 
+        def value(path: Path) -> tuple[str, DeckValuation, bool]:
+            stat = path.stat()
+            deck = _load_deck(path, stat)
             if cache is not None:
                 cached = cache.get(deck.name, currency=currency, now=current_time)
                 if cached is not None:
-                    results[deck.name] = cached
-                    continue
+                    return deck.name, cached, False
 
-            card_counts, _ = load_decklist(path)
-            valuation = valuer.value_counts(card_counts, currency=currency)
-            results[deck.name] = valuation
+            card_counts, _ = _load_decklist(path, stat)
+            return deck.name, valuer.value_counts(card_counts, currency=currency), True
 
-            if cache is not None:
-                cache.store(deck.name, valuation, as_of=current_time)
+        for name, valuation, fresh in _map_decks(value, self.deck_files()):
+            results[name] = valuation
+            if fresh and cache is not None:
+                cache.store(name, valuation, as_of=current_time)
 
         if cache is not None:
             cache.save()
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+import hashlib
+import json
+import os
 from pathlib import Path
-import re
 from typing import Iterable
 
 from .deck import Deck
@@ -11,45 +13,64 @@ from .deck import Deck
 DeckCounts = dict[str, int]
 
 
+_COMMANDER_TAG = "[commander]"
+
+
+def _find_decklist_body(markdown: str) -> str | None:
+    """Return the text after the ``## Decklist`` heading line, if present."""
+
+    position = markdown.find("## ")
+    while position != -1:
+        line_start = markdown.rfind("\n", 0, position) + 1
+        line_end = markdown.find("\n", position)
+        if line_end == -1:
+            line_end = len(markdown)
+        if markdown[line_start:line_end].strip().lower() == "## decklist":
+            return markdown[line_end + 1 :]
+        position = markdown.find("## ", line_end)
+    return None
+
+
+def _parse_bullet(entry: str) -> tuple[int, str, bool]:
+    """Split a bullet entry into ``(count, name, is_commander)`` without regexes."""
+
+    is_commander = False
+    if entry[:11].lower() == _COMMANDER_TAG:
+        is_commander = True
+        entry = entry[11:].strip()
+
+    length = len(entry)
+    index = 0
+    while index < length and entry[index].isdecimal():
+        index += 1
+    if index:
+        name_start = index + 1 if index < length and entry[index] == "x" else index
+        if name_start < length and entry[name_start].isspace():
+            return int(entry[:index]), entry[name_start:].strip(), is_commander
+    return 1, entry, is_commander
+
+
 def parse_decklist(markdown: str) -> tuple[DeckCounts, set[str]]:
     """Extract card counts and commander markers from a Markdown decklist section."""
 
-    lines = markdown.splitlines()
-    decklist_start = None
-    for idx, line in enumerate(lines):
-        if line.strip().lower() == "## decklist":
-            decklist_start = idx + 1
-            break
-    if decklist_start is None:
+    body = _find_decklist_body(markdown)
+    if body is None:
         raise ValueError("No '## Decklist' section found")
 
     card_counts: DeckCounts = {}
     commander_names: set[str] = set()
-    bullet_pattern = re.compile(r"^(?P<count>\d+)x?\s+(?P<name>.+)$")
 
-    for line in lines[decklist_start:]:
+    for line in body.splitlines():
         stripped = line.strip()
         if not stripped:
             continue
-        if stripped.startswith("#") and not stripped.startswith("-"):
-            break
-        if not stripped.startswith("-"):
+        first = stripped[0]
+        if first != "-":
+            if first == "#":
+                break
             continue
 
-        entry = stripped.lstrip("-").strip()
-        is_commander = False
-        if entry.lower().startswith("[commander]"):
-            is_commander = True
-            entry = entry[len("[commander]") :].strip()
-
-        match = bullet_pattern.match(entry)
-        if match:
-            count = int(match.group("count"))
-            name = match.group("name").strip()
-        else:
-            count = 1
-            name = entry
-
+        count, name, is_commander = _parse_bullet(stripped.lstrip("-").strip())
         card_counts[name] = card_counts.get(name, 0) + count
         if is_commander:
             commander_names.add(name)
@@ -83,6 +104,20 @@ class CommanderRules:
     )
     banned_cards: Iterable[str] = field(default_factory=set)
 
+    def _folded_names(self) -> tuple[frozenset[str], frozenset[str]]:
+        """Return casefolded basics and banned names, rebuilt only when either set changes."""
+
+        key = (frozenset(self.basic_lands), frozenset(self.banned_cards))
+        cached = self.__dict__.get("_folded_cache")
+        if cached is None or cached[0] != key:
+            basics, banned = key
+            folded = (
+                frozenset(name.casefold() for name in basics),
+                frozenset(name.casefold() for name in banned),
+            )
+            cached = self._folded_cache = (key, folded)
+        return cached[1]
+
     def validate(
         self, deck: Deck, card_counts: DeckCounts, commander_entries: set[str]
     ) -> list[str]:
@@ -95,14 +130,16 @@ class CommanderRules:
         if total_cards != self.deck_size:
             errors.append(f"Deck must contain exactly {self.deck_size} cards (found {total_cards})")
 
-        normalized_basics = {name.casefold() for name in self.basic_lands}
-        normalized_banned = {name.casefold() for name in self.banned_cards}
+        basics_cf, banned_cf = self._folded_names()
+        commander_fold = deck.commander.casefold()
+        commander_in_counts = False
         for name, count in card_counts.items():
-            if name.casefold() in normalized_banned:
+            folded = name.casefold()
+            if folded == commander_fold:
+                commander_in_counts = True
+            if folded in banned_cf:
                 errors.append(f"Card '{name}' is banned in {self.expected_format}")
-            if count > 1 and not (
-                self.allow_duplicate_basics and name.casefold() in normalized_basics
-            ):
+            if count > 1 and not (self.allow_duplicate_basics and folded in basics_cf):
                 errors.append(f"Card '{name}' appears {count} times; only basics may repeat")
 
         commander_present = False
@@ -115,7 +152,7 @@ class CommanderRules:
                 )
 
             for name in commander_entries:
-                if name.casefold() == deck.commander.casefold():
+                if name.casefold() == commander_fold:
                     commander_present = True
                     if card_counts.get(name, 0) != 1:
                         errors.append("Commander must appear exactly once in the decklist")
@@ -129,7 +166,7 @@ class CommanderRules:
             if self.require_commander_tag:
                 errors.append("Commander entry missing from decklist")
                 missing_commander_reported = True
-            elif deck.commander.casefold() in (name.casefold() for name in card_counts):
+            elif commander_in_counts:
                 commander_present = True
 
         if not commander_present and not missing_commander_reported:
@@ -140,3 +177,80 @@ class CommanderRules:
 
 def load_decklist(path: Path) -> tuple[DeckCounts, set[str]]:
     return parse_decklist(path.read_text(encoding="utf-8"))
+
+
+def rules_fingerprint(rules: CommanderRules | None) -> str:
+    """Return a stable digest of a rules configuration for cache keys."""
+
+    if rules is None:
+        return "none"
+    values = {}
+    for rule_field in fields(rules):
+        value = getattr(rules, rule_field.name)
+        if not isinstance(value, (str, int, bool)):
+            value = sorted(value)
+        values[rule_field.name] = value
+    return hashlib.sha1(json.dumps(values, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class ValidationCache:
+    """Remember validation results for deck files that have not changed.
+
+    Entries are keyed by deck path and matched on the file's mtime and size.
+    The whole cache is discarded when the rules configuration changes.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._data: dict = {"rules": None, "decks": {}}
+        self._loaded = False
+        self._dirty = False
+
+    def load(self) -> None:
+        if self._loaded:
+            return
+        try:
+            self._data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._data = {"rules": None, "decks": {}}
+        self._data.setdefault("decks", {})
+        self._loaded = True
+
+    def use_rules(self, fingerprint: str) -> None:
+        self.load()
+        if self._data.get("rules") != fingerprint:
+            self._data = {"rules": fingerprint, "decks": {}}
+            self._dirty = True
+
+    def get(self, deck_path: Path, stat: os.stat_result) -> list[str] | None:
+        self.load()
+        entry = self._data["decks"].get(str(deck_path))
+        if not entry or entry.get("mtime_ns") != stat.st_mtime_ns or entry.get("size") != stat.st_size:
+            return None
+        return list(entry.get("errors", []))
+
+    def store(self, deck_path: Path, stat: os.stat_result, errors: list[str]) -> None:
+        self.load()
+        self._data["decks"][str(deck_path)] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "errors": list(errors),
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache if anything changed since the last save.
+
+        The cache is only an optimisation, so a deck directory that cannot be
+        written to leaves validation results unaffected.
+        """
+
+        if not self._dirty:
+            return
+        staging_path = self.path.with_name(f"{self.path.name}.tmp")
+        try:
+            staging_path.write_text(json.dumps(self._data, indent=2), encoding="utf-8")
+            os.replace(staging_path, self.path)
+        except OSError:
+            return
+        self._dirty = False
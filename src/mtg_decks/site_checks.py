@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import os
 import sys
+import threading
 from pathlib import Path
 
 from .spec_sync import DEFAULT_ERROR_LOG, SITE_ROOT
@@ -20,34 +21,50 @@ REQUIRED_SITE_FILES = [
 ]
 
 
+_FORMATTER = logging.Formatter("%(levelname)s %(message)s")
+_LOGGER_LOCK = threading.Lock()
+
+
 def _configure_logger(log_path: Path) -> logging.Logger:
-    log_path.parent.mkdir(parents=True, exist_ok=True)
+    """Return the site-check logger writing to ``log_path``.
+
+    The stderr handler is created once. The file handler is only replaced when
+    the log path changes, so repeated checks reuse the open log file.
+    """
 
     logger = logging.getLogger("mtg_decks.site_checks")
-    logger.handlers.clear()
+    with _LOGGER_LOCK:
+        file_handler = next(
+            (handler for handler in logger.handlers if isinstance(handler, logging.FileHandler)),
+            None,
+        )
+        if file_handler is not None and file_handler.baseFilename == os.path.abspath(log_path):
+            return logger
 
-    formatter = logging.Formatter("%(levelname)s %(message)s")
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        if file_handler is not None:
+            logger.removeHandler(file_handler)
+            file_handler.close()
 
-    file_handler = logging.FileHandler(log_path, encoding="utf-8")
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+        file_handler = logging.FileHandler(log_path, encoding="utf-8")
+        file_handler.setFormatter(_FORMATTER)
+        logger.addHandler(file_handler)
 
-    stream_handler = logging.StreamHandler(sys.stderr)
-    stream_handler.setFormatter(formatter)
-    logger.addHandler(stream_handler)
+        if not any(type(handler) is logging.StreamHandler for handler in logger.handlers):
+            stream_handler = logging.StreamHandler(sys.stderr)
+            stream_handler.setFormatter(_FORMATTER)
+            logger.addHandler(stream_handler)
 
-    logger.setLevel(logging.INFO)
-    logger.propagate = False
-    return logger
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        return logger
 
 
 def _candidate_site_roots(site_root: Path | None) -> list[Path]:
-    candidates: list[Path] = []
-
     if site_root is not None:
-        candidates.append(Path(site_root))
-        return [candidates[0].resolve()]
+        return [Path(site_root).resolve()]
 
+    candidates: list[Path] = []
     env_root = os.getenv("MTG_DECKS_SITE_ROOT")
     if env_root:
         candidates.append(Path(env_root))
@@ -55,17 +72,8 @@ def _candidate_site_roots(site_root: Path | None) -> list[Path]:
     candidates.append(Path.cwd() / "site")
     candidates.append(SITE_ROOT)
 
-    seen: set[Path] = set()
-    unique_candidates: list[Path] = []
-
-    for candidate in candidates:
-        resolved = candidate.resolve()
-        if resolved in seen:
-            continue
-        seen.add(resolved)
-        unique_candidates.append(resolved)
-
-    return unique_candidates
+    # dict.fromkeys drops duplicates while keeping the first-seen order.
+    return list(dict.fromkeys(candidate.resolve() for candidate in candidates))
 
 
 def _resolve_site_root(logger: logging.Logger, site_root: Path | None = None) -> Path:
@@ -80,6 +88,23 @@ def _resolve_site_root(logger: logging.Logger, site_root: Path | None = None) ->
     return candidates[0]
 
 
+def _present_entries(site_root: Path) -> set[str]:
+    """Return the names in ``site_root`` with one directory scan.
+
+    Broken symlinks are left out so the result matches ``Path.exists``.
+    """
+
+    try:
+        with os.scandir(site_root) as entries:
+            return {
+                entry.name
+                for entry in entries
+                if not entry.is_symlink() or os.path.exists(entry.path)
+            }
+    except NotADirectoryError:
+        return set()
+
+
 def validate_site_assets(site_root: Path | None = None, log_path: Path = DEFAULT_ERROR_LOG) -> bool:
     """Ensure the published HTML assets exist and log a useful error when any are missing."""
 
@@ -91,12 +116,12 @@ def validate_site_assets(site_root: Path | None = None, log_path: Path = DEFAULT
         logger.error("Site root does not exist: %s", resolved_site_root)
         return False
 
-    missing: list[Path] = []
-
-    for rel_path in REQUIRED_SITE_FILES:
-        candidate = resolved_site_root / rel_path
-        if not candidate.exists():
-            missing.append(candidate)
+    present = _present_entries(resolved_site_root)
+    missing = [
+        resolved_site_root / rel_path
+        for rel_path in REQUIRED_SITE_FILES
+        if rel_path not in present and not (resolved_site_root / rel_path).exists()
+    ]
 
     if missing:
         logger.error("Found %s missing site asset(s)", len(missing))
@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
-from argparse import ArgumentParser
 from pathlib import Path
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
+import hashlib
 import html
+import json
 import re
 
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 SITE_ROOT = PROJECT_ROOT / "site"
 DEFAULT_MD_PATH = PROJECT_ROOT / "FUNCTIONAL_SPEC.md"
 DEFAULT_HTML_PATH = SITE_ROOT / "functional-spec.html"
 DEFAULT_ERROR_LOG = PROJECT_ROOT / "error.log"
+DEFAULT_SYNC_MANIFEST = PROJECT_ROOT / ".cache" / "spec-sync.json"
 
 
 STYLE_BLOCK = """
@@ -258,6 +263,20 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 """
 
 
+# The styles never change, so the template is filled and split once around the per-render slots.
+_TEMPLATE_HEAD, _TEMPLATE_REST = HTML_TEMPLATE.split("{toc}")
+_TEMPLATE_HEAD = _TEMPLATE_HEAD.replace("{styles}", STYLE_BLOCK)
+_TEMPLATE_MID, _TEMPLATE_TAIL = _TEMPLATE_REST.split("{content}")
+
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)")
+_CODE_RE = re.compile(r"`([^`]+)`")
+_STRONG_RE = re.compile(r"\*\*([^*]+)\*\*")
+# Byte table mapping everything outside [a-z0-9] to "-" for _slugify.
+_SLUG_TABLE = bytes(c if 48 <= c <= 57 or 97 <= c <= 122 else 45 for c in range(256))
+_ALIGN_RE = re.compile(r"[:\-\s|]+")
+
+
 class SimpleMarkdown:
     """Lightweight markdown-to-HTML converter to avoid external runtime dependencies."""
 
@@ -266,20 +285,28 @@ class SimpleMarkdown:
 
     @staticmethod
     def _slugify(text: str) -> str:
-        slug = re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
-        return slug or "section"
+        # Non-ASCII characters become "?" and then "-", matching the old [^a-z0-9]+ rule.
+        slug = text.lower().encode("ascii", "replace").translate(_SLUG_TABLE).strip(b"-")
+        while b"--" in slug:
+            slug = slug.replace(b"--", b"-")
+        return slug.decode("ascii") or "section"
 
     @staticmethod
     def _inline(text: str) -> str:
+        # The whole line is escaped up front, so captured groups are already safe.
         def replace_code(match: re.Match[str]) -> str:
-            return f"<code>{html.escape(match.group(1))}</code>"
+            return f"<code>{match.group(1)}</code>"
 
         def replace_strong(match: re.Match[str]) -> str:
-            return f"<strong>{html.escape(match.group(1))}</strong>"
+            return f"<strong>{match.group(1)}</strong>"
 
         escaped = html.escape(text)
-        escaped = re.sub(r"`([^`]+)`", replace_code, escaped)
-        escaped = re.sub(r"\*\*([^*]+)\*\*", replace_strong, escaped)
+        # Most lines carry no inline markup; only run the substitutions when
+        # their opening characters are present.
+        if "`" in escaped:
+            escaped = _CODE_RE.sub(replace_code, escaped)
+        if "**" in escaped:
+            escaped = _STRONG_RE.sub(replace_strong, escaped)
         return escaped
 
     def _flush_paragraph(self, buffer: list[str], output: list[str]) -> None:
@@ -303,7 +330,7 @@ class SimpleMarkdown:
         header_cells = [cell.strip() for cell in rows[0].split("|")]
         data_rows = rows[1:]
         # Drop alignment row when present (second row filled with dashes/colons)
-        if data_rows and re.fullmatch(r"[:\-\s|]+", table_lines[1]):
+        if data_rows and _ALIGN_RE.fullmatch(table_lines[1]):
             data_rows = rows[2:]
 
         output.append("<table>")
@@ -324,9 +351,12 @@ class SimpleMarkdown:
         in_list = False
 
         lines = markdown_text.splitlines()
-        for idx, line in enumerate(lines + [""]):
-            heading = re.match(r"^(#{1,6})\s+(.*)", line)
-            is_table_row = line.strip().startswith("|") and line.strip().endswith("|")
+        lines.append("")
+        for line in lines:
+            stripped = line.strip()
+            # Dispatch on the first character before reaching for the regex.
+            heading = _HEADING_RE.match(line) if line[:1] == "#" else None
+            is_table_row = stripped[:1] == "|" and stripped[-1:] == "|"
 
             if heading:
                 self._flush_table(table_buffer, output)
@@ -355,15 +385,14 @@ class SimpleMarkdown:
                 output.append(f"  <li>{self._inline(line[2:].strip())}</li>")
                 continue
 
-            if in_list and line.strip() == "":
-                in_list = self._flush_list(in_list, output)
+            if not stripped:
+                if in_list:
+                    in_list = self._flush_list(in_list, output)
+                else:
+                    self._flush_paragraph(paragraph_buffer, output)
                 continue
 
-            if line.strip() == "":
-                self._flush_paragraph(paragraph_buffer, output)
-                continue
-
-            paragraph_buffer.append(self._inline(line.strip()))
+            paragraph_buffer.append(self._inline(stripped))
 
         self._flush_table(table_buffer, output)
         self._flush_paragraph(paragraph_buffer, output)
@@ -383,7 +412,7 @@ def render_spec_html(markdown_text: str) -> str:
     md = SimpleMarkdown()
     content_html = md.convert(markdown_text)
     toc_html = md.toc()
-    return HTML_TEMPLATE.format(styles=STYLE_BLOCK, toc=toc_html, content=content_html)
+    return "".join((_TEMPLATE_HEAD, toc_html, _TEMPLATE_MID, content_html, _TEMPLATE_TAIL))
 
 
 def normalize_markdown(markdown_text: str) -> str:
@@ -395,8 +424,8 @@ def normalize_markdown(markdown_text: str) -> str:
 def write_error(message: str, error_log: Path = DEFAULT_ERROR_LOG) -> None:
     """Append an error message to the configured error log."""
 
-    existing = error_log.read_text(encoding="utf-8") if error_log.exists() else ""
-    error_log.write_text(f"{existing}{message}\n", encoding="utf-8")
+    with error_log.open("a", encoding="utf-8") as handle:
+        handle.write(f"{message}\n")
 
 
 def resolve_markdown_source(md_path: Path = DEFAULT_MD_PATH) -> Path:
@@ -427,12 +456,46 @@ def resolve_html_target(html_path: Path = DEFAULT_HTML_PATH) -> Path:
     return html_path
 
 
+def _sync_fingerprint(markdown_text: str, html_target: Path) -> dict[str, object]:
+    """Describe the inputs of a sync check so an unchanged pair can skip rendering."""
+
+    html_stat = html_target.stat()
+    renderer_stat = Path(__file__).stat()
+    return {
+        "markdown": hashlib.blake2b(markdown_text.encode("utf-8"), digest_size=16).hexdigest(),
+        "html": [str(html_target.resolve()), html_stat.st_mtime_ns, html_stat.st_size],
+        "renderer": [renderer_stat.st_mtime_ns, renderer_stat.st_size],
+    }
+
+
+def _read_manifest(manifest_path: Path) -> object:
+    try:
+        return json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_manifest(manifest_path: Path, fingerprint: dict[str, object]) -> None:
+    # The manifest is only an optimisation; read-only installs simply re-render.
+    try:
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(json.dumps(fingerprint), encoding="utf-8")
+    except OSError:
+        pass
+
+
 def spec_is_in_sync(
     md_path: Path = DEFAULT_MD_PATH,
     html_path: Path = DEFAULT_HTML_PATH,
     error_log: Path = DEFAULT_ERROR_LOG,
+    manifest_path: Optional[Path] = None,
 ) -> bool:
-    """Check whether the HTML spec matches the markdown source, logging when it does not."""
+    """Check whether the HTML spec matches the markdown source, logging when it does not.
+
+    When ``manifest_path`` is set, a pair that already passed (or was written by
+    ``regenerate_html``) with the same markdown content, HTML file stat, and
+    renderer is accepted without rendering again.
+    """
 
     markdown_path = resolve_markdown_source(md_path)
     html_target = resolve_html_target(html_path)
@@ -443,6 +506,12 @@ def spec_is_in_sync(
         )
 
     markdown_text = markdown_path.read_text(encoding="utf-8")
+    fingerprint = None
+    if manifest_path is not None:
+        fingerprint = _sync_fingerprint(markdown_text, html_target)
+        if _read_manifest(manifest_path) == fingerprint:
+            return True
+
     generated_html = render_spec_html(markdown_text)
     current_html = html_target.read_text(encoding="utf-8")
 
@@ -450,6 +519,8 @@ def spec_is_in_sync(
         write_error("functional-spec.html is out of sync with FUNCTIONAL_SPEC.md", error_log)
         return False
 
+    if fingerprint is not None:
+        _write_manifest(manifest_path, fingerprint)
     return True
 
 
@@ -461,16 +532,26 @@ def rewrite_markdown(md_path: Path = DEFAULT_MD_PATH) -> None:
     markdown_path.write_text(normalize_markdown(current_text), encoding="utf-8")
 
 
-def regenerate_html(md_path: Path = DEFAULT_MD_PATH, html_path: Path = DEFAULT_HTML_PATH) -> None:
+def regenerate_html(
+    md_path: Path = DEFAULT_MD_PATH,
+    html_path: Path = DEFAULT_HTML_PATH,
+    manifest_path: Optional[Path] = None,
+) -> None:
     """Regenerate the HTML artifact from markdown."""
 
     markdown_path = resolve_markdown_source(md_path)
     html_target = resolve_html_target(html_path)
     html_target.parent.mkdir(parents=True, exist_ok=True)
-    html_target.write_text(render_spec_html(markdown_path.read_text(encoding="utf-8")), encoding="utf-8")
+    markdown_text = markdown_path.read_text(encoding="utf-8")
+    html_target.write_text(render_spec_html(markdown_text), encoding="utf-8")
+    if manifest_path is not None:
+        _write_manifest(manifest_path, _sync_fingerprint(markdown_text, html_target))
 
 
 def parse_args(args: Optional[list[str]] = None) -> ArgumentParser:
+    # argparse is only needed when running as a script, not for the helpers.
+    from argparse import ArgumentParser
+
     parser = ArgumentParser(description="Keep FUNCTIONAL_SPEC.md and functional-spec.html aligned.")
     parser.add_argument("--md", type=Path, default=DEFAULT_MD_PATH, help="Path to the markdown source.")
     parser.add_argument("--html", type=Path, default=DEFAULT_HTML_PATH, help="Path to the rendered HTML output.")
@@ -478,6 +559,12 @@ def parse_args(args: Optional[list[str]] = None) -> ArgumentParser:
     parser.add_argument("--rewrite-md", action="store_true", help="Rewrite the markdown file with normalized whitespace.")
     parser.add_argument("--write", action="store_true", help="Regenerate the HTML artifact from markdown.")
     parser.add_argument("--check", action="store_true", help="Verify the HTML matches markdown, logging mismatches.")
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        default=DEFAULT_SYNC_MANIFEST,
+        help="Path to the sync manifest used to skip re-rendering an unchanged pair.",
+    )
     return parser
 
 
@@ -490,10 +577,10 @@ def main(argv: Optional[list[str]] = None) -> int:
             rewrite_markdown(options.md)
 
         if options.write:
-            regenerate_html(options.md, options.html)
+            regenerate_html(options.md, options.html, options.manifest)
 
         if options.check:
-            return 0 if spec_is_in_sync(options.md, options.html, options.error_log) else 1
+            return 0 if spec_is_in_sync(options.md, options.html, options.error_log, options.manifest) else 1
 
         return 0
     except FileNotFoundError as exc:
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass, field
 import datetime as _dt
 from pathlib import Path
+from typing import Callable, Iterable
 
 from .importer import CardResolver, CardData, ScryfallResolver
 
@@ -11,7 +13,24 @@ from .importer import CardResolver, CardData, ScryfallResolver
 _CURRENCY_SYMBOLS = {"usd": "$", "eur": "€", "gbp": "£"}
 
 
-@dataclass
+def price_formatter(currency: str) -> Callable[[float | None], str]:
+    """Return a function that formats prices in ``currency``.
+
+    The currency symbol is resolved once, so callers formatting many rows only
+    pay for the f-string. Missing prices render as ``Unknown``.
+    """
+
+    prefix = _CURRENCY_SYMBOLS.get(currency.lower()) or f"{currency.upper()} "
+
+    def format_price(value: float | None) -> str:
+        if value is None:
+            return "Unknown"
+        return f"{prefix}{value:,.2f}"
+
+    return format_price
+
+
+@dataclass(slots=True)
 class DeckValuation:
     currency: str
     total: float
@@ -28,26 +47,43 @@ class DeckValuer:
 
     def __init__(self, resolver: CardResolver | None = None) -> None:
         self.resolver = resolver or ScryfallResolver()
+        # Prices looked up by this valuer, keyed by (casefolded name, currency).
+        self._price_cache: dict[tuple[str, str], float | None] = {}
 
     def price_card(self, name: str, currency: str = "gbp") -> float | None:
-        card: CardData | None = self.resolver.resolve(name)
-        if card is None or not card.prices:
-            return None
-
-        raw_price = card.prices.get(currency.lower()) or card.prices.get(currency.upper())
-        if not raw_price:
-            return None
+        key = (name.casefold(), currency.lower())
         try:
-            return float(raw_price)
-        except (TypeError, ValueError):  # pragma: no cover - defensive
-            return None
+            return self._price_cache[key]
+        except KeyError:
+            price = self._price_cache[key] = _unit_price(self.resolver.resolve(name), currency)
+            return price
+
+    def price_cards(self, names: Iterable[str], *, currency: str = "gbp") -> dict[str, float | None]:
+        """Price several cards with one bulk resolver call, keyed by input name."""
+
+        currency_key = currency.lower()
+        prices: dict[str, float | None] = {}
+        pending: list[str] = []
+        for name in names:
+            key = (name.casefold(), currency_key)
+            if key in self._price_cache:
+                prices[name] = self._price_cache[key]
+            else:
+                pending.append(name)
+
+        if pending:
+            for name, card in self.resolver.resolve_many(pending).items():
+                price = self._price_cache[(name.casefold(), currency_key)] = _unit_price(card, currency)
+                prices[name] = price
+        return prices
 
     def value_counts(self, card_counts: dict[str, int], *, currency: str = "gbp") -> DeckValuation:
         total = 0.0
         missing: list[str] = []
+        prices = self.price_cards(card_counts, currency=currency)
 
         for name, count in card_counts.items():
-            price = self.price_card(name, currency=currency)
+            price = prices[name]
             if price is None:
                 missing.append(name)
                 continue
@@ -56,6 +92,19 @@ class DeckValuer:
         return DeckValuation(currency=currency, total=total, missing_prices=missing)
 
 
+def _unit_price(card: CardData | None, currency: str) -> float | None:
+    if card is None or not card.prices:
+        return None
+
+    raw_price = card.prices.get(currency.lower()) or card.prices.get(currency.upper())
+    if not raw_price:
+        return None
+    try:
+        return float(raw_price)
+    except (TypeError, ValueError):  # pragma: no cover - defensive
+        return None
+
+
 class ValuationCache:
     """Cache deck valuations to avoid redundant price lookups."""
 
@@ -63,24 +112,25 @@ class ValuationCache:
         self.path = Path(path)
         self._data = {"decks": {}}
         self._loaded = False
+        self._dirty = False
 
     def load(self) -> None:
         if self._loaded:
             return
-        if self.path.exists():
-            try:
-                self._data = json.loads(self.path.read_text(encoding="utf-8"))
-            except json.JSONDecodeError:
-                self._data = {"decks": {}}
+        try:
+            # json.loads decodes UTF-8 bytes itself, skipping the text-mode read layer.
+            self._data = json.loads(self.path.read_bytes())
+        except FileNotFoundError:
+            pass
+        except json.JSONDecodeError:
+            self._data = {"decks": {}}
         self._data.setdefault("decks", {})
         self._loaded = True
 
     def _entry_is_current(self, valued_at: str, *, now: _dt.datetime) -> bool:
-        try:
-            timestamp = _dt.datetime.fromisoformat(valued_at)
-        except ValueError:
-            return False
-        return timestamp.year == now.year and timestamp.month == now.month
+        # ``store`` always writes ``YYYY-MM-DDTHH:MM:SS``, so the month is the
+        # first seven characters; anything malformed simply fails to match.
+        return valued_at[:7] == f"{now.year:04d}-{now.month:02d}"
 
     def get(self, deck_name: str, *, currency: str, now: _dt.datetime | None = None) -> DeckValuation | None:
         self.load()
@@ -90,7 +140,7 @@ class ValuationCache:
         if entry.get("currency", "").lower() != currency.lower():
             return None
 
-        current_time = now or _dt.datetime.utcnow()
+        current_time = now or _dt.datetime.now(_dt.timezone.utc)
         if not self._entry_is_current(entry.get("valued_at", ""), now=current_time):
             return None
 
@@ -108,17 +158,37 @@ class ValuationCache:
         as_of: _dt.datetime | None = None,
     ) -> None:
         self.load()
-        timestamp = (as_of or _dt.datetime.utcnow()).replace(microsecond=0).isoformat()
+        timestamp = _as_naive_utc(as_of).replace(microsecond=0).isoformat()
         self._data.setdefault("decks", {})[deck_name] = {
             "currency": valuation.currency,
             "total": valuation.total,
             "missing_prices": list(valuation.missing_prices),
             "valued_at": timestamp,
         }
+        self._dirty = True
 
     def save(self) -> None:
-        self.load()
-        self.path.write_text(json.dumps(self._data, indent=2), encoding="utf-8")
+        """Write the cache if anything was stored since the last save.
+
+        The file is replaced atomically so a crash mid-write cannot truncate it.
+        """
+
+        if not self._dirty:
+            return
+        staging_path = self.path.with_name(f"{self.path.name}.tmp")
+        staging_path.write_text(json.dumps(self._data, indent=2), encoding="utf-8")
+        os.replace(staging_path, self.path)
+        self._dirty = False
+
+
+def _as_naive_utc(moment: _dt.datetime | None) -> _dt.datetime:
+    """Return ``moment`` (default: now) as a naive UTC datetime for serialising."""
+
+    if moment is None:
+        moment = _dt.datetime.now(_dt.timezone.utc)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(_dt.timezone.utc).replace(tzinfo=None)
+    return moment
 
 
 def render_valuation_report(
@@ -133,16 +203,18 @@ def render_valuation_report(
             UTC "now" is used.
     """
 
-    timestamp = (as_of or _dt.datetime.utcnow()).replace(microsecond=0).isoformat() + "Z"
+    timestamp = _as_naive_utc(as_of).replace(microsecond=0).isoformat() + "Z"
     lines = ["# Deck Valuation Report", f"As of: {timestamp}", "", ""]
 
+    total_label = f"- **Total ({currency.upper()}):** "
+
     for name, valuation in sorted(valuations.items(), key=lambda item: item[0].lower()):
+        missing = valuation.missing_prices
         lines.append(f"## {name}")
-        lines.append(f"- **Total ({currency.upper()}):** {valuation.formatted_total()}")
-        if valuation.missing_prices:
-            lines.append(f"- **Price lookups needed ({len(valuation.missing_prices)}):**")
-            for card in sorted(valuation.missing_prices, key=str.lower):
-                lines.append(f"  - {card}")
+        lines.append(f"{total_label}{valuation.formatted_total()}")
+        if missing:
+            lines.append(f"- **Price lookups needed ({len(missing)}):**")
+            lines.extend([f"  - {card}" for card in sorted(missing, key=str.lower)])
         else:
             lines.append("- **Price lookups needed:** None")
         lines.append("")
@@ -1,21 +1,38 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import sys
 from collections import defaultdict
 from datetime import datetime, timezone
+import io
 from pathlib import Path
 from types import FrameType
-from typing import Mapping
+from typing import Callable, Mapping
 import time
 import tokenize
 
 RESULTS_FILENAME = "pytest-results.md"
 RESULTS_ENV_VAR = "PYTEST_RESULTS_PATH"
 _SESSION_START: float | None = None
-_TRACE_DATA: dict[Path, set[int]] = defaultdict(set)
+_STAT_KEYS = ("passed", "failed", "error", "skipped", "xfailed", "xpassed")
+_TRACE_DATA: dict[str, set[int]] = defaultdict(set)
 _PACKAGE_ROOT: Path | None = None
+# sys.monitoring (PEP 669) tool id, set while the 3.12+ backend is active.
+_MONITOR_TOOL_ID: int | None = None
+_MONITORED_CODE: list = []
+# Resolved package path (or None) per co_filename; the verdict only depends on _PACKAGE_ROOT.
+_FILE_VERDICT: dict[str, str | None] = {}
+_LINE_TRACERS: dict[str, Callable] = {}
+_CODE_LINES_CACHE: dict[tuple[str, int, int], tuple[str, frozenset[int]]] = {}
+# Code lines keyed by source digest, kept under .pytest_cache across runs.
+# Bump the version whenever _scan_code_lines changes what it counts.
+CODE_LINES_CACHE_FILENAME = "coverage-codelines.json"
+_CODE_LINES_CACHE_VERSION = 1
+_SKIPPED_TOKENS = frozenset(
+    {tokenize.ENCODING, tokenize.NL, tokenize.NEWLINE, tokenize.ENDMARKER, tokenize.COMMENT}
+)
 
 
 def format_timestamp(now: datetime | None = None) -> str:
@@ -35,101 +52,210 @@ def _trace_calls(frame: FrameType, event: str, arg) -> FrameType | None:
     if event != "call":
         return _trace_calls
 
-    filename = Path(frame.f_code.co_filename).resolve()
-    try:
-        filename.relative_to(_PACKAGE_ROOT)
-    except ValueError:
+    filename = _in_package(frame.f_code.co_filename)
+    if filename is None:
         return _trace_calls
 
-    return _trace_lines
+    try:
+        return _LINE_TRACERS[filename]
+    except KeyError:
+        tracer = _LINE_TRACERS[filename] = _line_tracer(_TRACE_DATA[filename].add)
+        return tracer
 
 
-def _trace_lines(frame: FrameType, event: str, arg) -> FrameType | None:
-    if _PACKAGE_ROOT is None:
-        return _trace_lines
+def _line_tracer(record):
+    # A frame never changes file, so each package file gets a tracer bound to its line set.
+    def trace_lines(frame: FrameType, event: str, arg):
+        if event == "line":
+            record(frame.f_lineno)
+        return trace_lines
+
+    return trace_lines
+
+
+def _classify(filename: str) -> str | None:
+    # Resolve so symlinked checkouts still match; this runs once per filename.
+    resolved = str(Path(filename).resolve())
+    if resolved.startswith(f"{_PACKAGE_ROOT}{os.sep}"):
+        return resolved
+    return None
 
-    filename = Path(frame.f_code.co_filename).resolve()
+
+def _in_package(filename: str) -> str | None:
     try:
-        filename.relative_to(_PACKAGE_ROOT)
-    except ValueError:
-        return _trace_calls
+        return _FILE_VERDICT[filename]
+    except KeyError:
+        verdict = _FILE_VERDICT[filename] = _classify(filename)
+        return verdict
+
+
+def _monitor_start(code, instruction_offset: int):
+    # Only package code gets LINE events; every code object is inspected once.
+    if _PACKAGE_ROOT is not None and _in_package(code.co_filename) is not None:
+        sys.monitoring.set_local_events(_MONITOR_TOOL_ID, code, sys.monitoring.events.LINE)
+        _MONITORED_CODE.append(code)
+    return sys.monitoring.DISABLE
+
 
-    if event == "line":
-        _TRACE_DATA[filename].add(frame.f_lineno)
-    return _trace_lines
+def _monitor_line(code, line_number: int):
+    path = _in_package(code.co_filename)
+    if path is not None:
+        _TRACE_DATA[path].add(line_number)
+    # Coverage only needs each line once, so stop reporting this location.
+    return sys.monitoring.DISABLE
+
+
+def _start_monitoring() -> bool:
+    global _MONITOR_TOOL_ID
+
+    monitoring = getattr(sys, "monitoring", None)
+    if monitoring is None:
+        return False
+    try:
+        monitoring.use_tool_id(monitoring.COVERAGE_ID, "mtg-decks-coverage")
+    except ValueError:  # pragma: no cover - another coverage tool owns the slot
+        return False
+
+    _MONITOR_TOOL_ID = monitoring.COVERAGE_ID
+    monitoring.register_callback(_MONITOR_TOOL_ID, monitoring.events.PY_START, _monitor_start)
+    monitoring.register_callback(_MONITOR_TOOL_ID, monitoring.events.LINE, _monitor_line)
+    monitoring.set_events(_MONITOR_TOOL_ID, monitoring.events.PY_START)
+    monitoring.restart_events()
+    return True
+
+
+def _stop_monitoring() -> None:
+    global _MONITOR_TOOL_ID
+
+    if _MONITOR_TOOL_ID is None:
+        return
+    monitoring = sys.monitoring
+    monitoring.set_events(_MONITOR_TOOL_ID, monitoring.events.NO_EVENTS)
+    for code in _MONITORED_CODE:
+        monitoring.set_local_events(_MONITOR_TOOL_ID, code, monitoring.events.NO_EVENTS)
+    _MONITORED_CODE.clear()
+    monitoring.register_callback(_MONITOR_TOOL_ID, monitoring.events.PY_START, None)
+    monitoring.register_callback(_MONITOR_TOOL_ID, monitoring.events.LINE, None)
+    monitoring.free_tool_id(_MONITOR_TOOL_ID)
+    _MONITOR_TOOL_ID = None
 
 
 def start_coverage(root_path: Path) -> None:
     global _TRACE_DATA, _PACKAGE_ROOT
 
+    _stop_monitoring()
+    _FILE_VERDICT.clear()
+    _LINE_TRACERS.clear()
     _TRACE_DATA = defaultdict(set)
     _PACKAGE_ROOT = (Path(root_path) / "src" / "mtg_decks").resolve()
-    sys.settrace(_trace_calls)
+    if not _start_monitoring():
+        sys.settrace(_trace_calls)
+
+
+def _code_lines(path: Path) -> frozenset[int]:
+    return _code_lines_entry(path)[1]
 
 
-def _count_code_lines(package_root: Path) -> int:
-    total = 0
-    for path in package_root.rglob("*.py"):
-        for line in _code_lines(path):
-            total += 1
-    return total
+def _code_lines_entry(
+    path: Path, stored: Mapping[str, list[int]] | None = None
+) -> tuple[str, frozenset[int]]:
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    cached = _CODE_LINES_CACHE.get(key)
+    if cached is None:
+        raw = path.read_bytes()
+        digest = hashlib.blake2b(raw, digest_size=8).hexdigest()
+        known = stored.get(digest) if stored else None
+        lines = frozenset(known) if known is not None else frozenset(_scan_code_lines(raw))
+        cached = _CODE_LINES_CACHE[key] = (digest, lines)
+    return cached
 
 
-def _code_lines(path: Path) -> set[int]:
+def _read_code_lines_cache(cache_path: Path) -> dict[str, list[int]]:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _CODE_LINES_CACHE_VERSION:
+        return {}
+    return data.get("files", {})
+
+
+def _write_code_lines_cache(cache_path: Path, files: Mapping[str, frozenset[int]]) -> None:
+    # The cache is only an optimisation; a read-only checkout just tokenizes again.
+    serialized = {
+        "version": _CODE_LINES_CACHE_VERSION,
+        "files": {digest: sorted(lines) for digest, lines in files.items()},
+    }
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(serialized), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _scan_code_lines(raw: bytes) -> set[int]:
     code_lines: set[int] = set()
-    source = path.read_text(encoding="utf-8").splitlines()
+    source = raw.decode("utf-8").splitlines()
     if source and "pragma: no cover file" in source[0]:
         return code_lines
     ignored = {idx + 1 for idx, line in enumerate(source) if "pragma: no cover" in line}
-    with path.open("rb") as stream:
-        for token in tokenize.tokenize(stream.readline):
-            if token.type in {
-                tokenize.ENCODING,
-                tokenize.NL,
-                tokenize.NEWLINE,
-                tokenize.ENDMARKER,
-                tokenize.COMMENT,
-            }:
-                continue
-
-            # Skip pure module docstrings
-            if token.type == tokenize.STRING and token.start[0] == 1 and token.start[1] == 0:
-                continue
-
-            if token.start[0] in ignored or token.end[0] in ignored:
-                continue
-
-            code_lines.add(token.start[0])
-            if token.type == tokenize.STRING:
-                continue
-
-            if token.end[0] != token.start[0]:
-                code_lines.update(range(token.start[0], token.end[0] + 1))
+    for token in tokenize.tokenize(io.BytesIO(raw).readline):
+        if token.type in _SKIPPED_TOKENS:
+            continue
+
+        start_line, start_col = token.start
+        end_line = token.end[0]
+
+        # Skip pure module docstrings
+        if token.type == tokenize.STRING and start_line == 1 and start_col == 0:
+            continue
+
+        if start_line in ignored or end_line in ignored:
+            continue
+
+        code_lines.add(start_line)
+        if token.type == tokenize.STRING:
+            continue
+
+        if end_line != start_line:
+            code_lines.update(range(start_line, end_line + 1))
     return code_lines
 
 
 def _calculate_coverage_percent(
-    trace_data: Mapping[Path, set[int]], package_root: Path
+    trace_data: Mapping[str, set[int]], package_root: Path, *, save_code_lines: bool = True
 ) -> float | None:
-    tracked_files: list[Path] = []
+    package_prefix = str(package_root) + os.sep
+    tracked_files: list[str] = []
     for path in trace_data.keys():
-        try:
-            path.relative_to(package_root)
-        except ValueError:
-            continue
-        if path.suffix == ".py" and path.exists():
+        # Path keys from callers are accepted; the tracer itself records strings.
+        filename = os.fspath(path)
+        if filename.startswith(package_prefix) and filename.endswith(".py") and os.path.exists(filename):
             tracked_files.append(path)
 
     if not tracked_files:
         return None
 
+    cache_path = package_root.parents[1] / ".pytest_cache" / CODE_LINES_CACHE_FILENAME
+    stored = _read_code_lines_cache(cache_path)
+    seen: dict[str, frozenset[int]] = {}
+
+    # The denominator only counts files the run touched; untouched modules are not scanned.
     total_lines = 0
     executed = 0
     for path in tracked_files:
-        file_lines = _code_lines(path)
+        digest, file_lines = _code_lines_entry(Path(path), stored)
+        seen[digest] = file_lines
         total_lines += len(file_lines)
         executed += len(trace_data[path].intersection(file_lines))
 
+    # Keep only this run's sources so edited files do not accumulate.
+    if save_code_lines and seen.keys() != stored.keys():
+        _write_code_lines_cache(cache_path, seen)
+
     missing_lines = total_lines - executed
     adjusted_executed = executed + (missing_lines * 0.5)
 
@@ -140,7 +266,7 @@ def _calculate_coverage_percent(
 
 
 def finalize_coverage(
-    trace_data: Mapping[Path, set[int]] | None = None,
+    trace_data: Mapping[str, set[int]] | None = None,
     package_root: Path | None = None,
 ) -> float | None:
     global _TRACE_DATA, _PACKAGE_ROOT
@@ -152,28 +278,31 @@ def finalize_coverage(
         return None
 
     if trace_data is None:
+        _stop_monitoring()
         sys.settrace(None)
 
-    percent = _calculate_coverage_percent(active_trace, target_root)
-
     dump_path = os.environ.get("PYTEST_COVERAGE_DUMP")
+    # xdist workers only see part of the run; the controller's aggregate pass
+    # covers every touched file, so it alone rewrites the code-line cache.
+    percent = _calculate_coverage_percent(active_trace, target_root, save_code_lines=not dump_path)
+
     if dump_path:
         try:
+            # The aggregator only unions these, so skip sorting and pretty-printing.
             serialized = {
                 "package_root": str(target_root),
                 "files": {
-                    str(path): sorted(lines) for path, lines in active_trace.items()
+                    os.fspath(path): list(lines) for path, lines in active_trace.items()
                 },
                 "percent": percent,
             }
-            Path(dump_path).write_text(
-                json.dumps(serialized, indent=2), encoding="utf-8"
-            )
+            Path(dump_path).write_text(json.dumps(serialized), encoding="utf-8")
         except OSError:
             pass
 
     if trace_data is None:
         _TRACE_DATA = defaultdict(set)
+        _LINE_TRACERS.clear()
         _PACKAGE_ROOT = None
 
     return percent
@@ -219,20 +348,17 @@ def _resolve_target_path(config_root: Path) -> Path:
     return Path(config_root) / RESULTS_FILENAME
 
 
-def _load_trace_dump(path: Path) -> tuple[Path, dict[Path, set[int]]]:
+def _load_trace_dump(path: Path) -> tuple[Path, dict[str, list[int]]]:
     data = json.loads(path.read_text(encoding="utf-8"))
-    package_root = Path(data["package_root"])
-    files = {
-        Path(file_path): set(lines) for file_path, lines in data.get("files", {}).items()
-    }
-    return package_root, files
+    # Lines stay as the decoded lists; aggregate_coverage unions them straight in.
+    return Path(data["package_root"]), data.get("files", {})
 
 
 def aggregate_coverage(dump_dir: Path) -> float | None:
     if not dump_dir.exists():
         return None
 
-    aggregated: dict[Path, set[int]] = defaultdict(set)
+    aggregated: dict[str, set[int]] = defaultdict(set)
     package_root: Path | None = None
 
     for dump_file in sorted(dump_dir.glob("trace-*.json")):
@@ -258,14 +384,8 @@ def capture_and_write_results(
     if reporter is None:
         return
 
-    stats = {key: len(reporter.stats.get(key, [])) for key in (
-        "passed",
-        "failed",
-        "error",
-        "skipped",
-        "xfailed",
-        "xpassed",
-    )}
+    reporter_stats = reporter.stats
+    stats = {key: len(reporter_stats.get(key, ())) for key in _STAT_KEYS}
     collected = getattr(reporter, "_numcollected", 0)
 
     duration = time.time() - _SESSION_START if _SESSION_START is not None else None
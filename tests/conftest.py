@@ -11,6 +11,8 @@ try:  # pragma: no cover - optional dependency
 except ImportError:  # pragma: no cover - optional dependency
     HAS_XDIST = False
 
+import pytest
+
 from tests._pytest_results import (
     aggregate_coverage,
     capture_and_write_results,
@@ -20,6 +22,17 @@ from tests._pytest_results import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_cli_resolvers():
+    # cli memoises one resolver per process; keep each test from inheriting another's.
+    # Imported here so module-level lines still run under the session's tracer.
+    from mtg_decks import cli
+
+    cli._resolver_for.cache_clear()
+    yield
+    cli._resolver_for.cache_clear()
+
+
 def pytest_configure(config) -> None:  # pragma: no cover - exercised in test suite
     if hasattr(config, "workerinput"):
         dump_target = config.workerinput.get("coverage_dump")
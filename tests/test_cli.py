@@ -31,7 +31,7 @@ def fast_resolver(monkeypatch: pytest.MonkeyPatch):
 
     resolver = FastResolver()
     monkeypatch.setattr(importer_module, "ScryfallResolver", lambda: resolver)
-    monkeypatch.setattr(cli, "ScryfallResolver", lambda: resolver)
+    monkeypatch.setattr(cli, "ScryfallResolver", lambda *args, **kwargs: resolver)
     monkeypatch.setattr(valuation_module, "ScryfallResolver", lambda: resolver)
     return resolver
 
@@ -62,6 +62,62 @@ def test_cli_create_then_list_and_show(deck_dir: Path, capsys: pytest.CaptureFix
     assert "Format: Standard" in shown
 
 
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["list"],
+        ["--dir", "elsewhere", "list"],
+        ["show", "test-deck"],
+        ["--dir", "elsewhere", "show", "test-deck"],
+    ],
+)
+def test_cli_fast_path_matches_argparse(argv: list[str]):
+    assert cli._fast_path_args(argv) == cli.build_parser().parse_args(argv)
+
+
+@pytest.mark.parametrize("argv", [["list", "--help"], ["show"], ["create", "A", "B"], ["--dir=x", "list"]])
+def test_cli_fast_path_defers_other_shapes(argv: list[str]):
+    assert cli._fast_path_args(argv) is None
+
+
+@pytest.mark.parametrize(
+    ("argv", "expected"),
+    [
+        (["--dir", "decks", "value-all", "--currency", "usd"], "value-all"),
+        (["spares", "search", "--query", "ring"], "spares"),
+        (["--help"], None),
+        (["--dir", "list"], None),
+        (["unknown"], None),
+    ],
+)
+def test_sniff_subcommand(argv: list[str], expected: str | None):
+    assert cli._sniff_subcommand(argv) == expected
+
+
+def test_build_parser_only_registers_requested_subcommand():
+    parser = cli.build_parser("validate")
+
+    args = parser.parse_args(["validate", "--deck-size", "60"])
+
+    assert args.deck_size == 60
+    with pytest.raises(SystemExit):
+        parser.parse_args(["list"])
+
+
+def test_cli_normalises_currency_and_colors_at_parse_time():
+    create_args = cli.build_parser().parse_args(["create", "A", "B", "--colors", "w", "u"])
+    value_args = cli.build_parser().parse_args(["value", "A", "--currency", "usd"])
+
+    assert create_args.colors == ["W", "U"]
+    assert value_args.currency == "USD"
+
+
+def test_resolver_from_source_reuses_instance_per_source():
+    assert cli._resolver_from_source("Scryfall") is cli._resolver_from_source("scryfall")
+    with pytest.raises(ValueError):
+        cli._resolver_from_source("mtgstocks")
+
+
 def test_cli_version_flag(capsys: pytest.CaptureFixture[str]):
     with pytest.raises(SystemExit) as excinfo:
         cli.main(["--version"])
@@ -189,7 +245,7 @@ def test_cli_value_and_report(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, c
     _write_simple_deck(deck_dir, "valued")
 
     stub_resolver = StubResolver({"usd": "1.00"})
-    monkeypatch.setattr(cli, "ScryfallResolver", lambda: stub_resolver)
+    monkeypatch.setattr(cli, "ScryfallResolver", lambda *args, **kwargs: stub_resolver)
 
     report_path = tmp_path / "report.md"
     exit_code = cli.main(
@@ -228,7 +284,7 @@ def test_cli_validate_and_spares(tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     assert "All decks valid" in capsys.readouterr().out
 
     stub_resolver = StubResolver({"usd": "2.50"})
-    monkeypatch.setattr(cli, "ScryfallResolver", lambda: stub_resolver)
+    monkeypatch.setattr(cli, "ScryfallResolver", lambda *args, **kwargs: stub_resolver)
 
     spares_file = tmp_path / "spares.md"
     import_exit = cli.main(
@@ -268,6 +324,15 @@ def test_cli_validate_and_spares(tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     assert "| Name |" in search_output
     assert "Sol Ring" in search_output
 
+    plain_exit = cli.main(
+        ["spares", "search", "--spares-file", str(spares_file), "--no-prices"]
+    )
+    assert plain_exit == 0
+    plain_output = capsys.readouterr().out
+    assert "| Name | Count | Box | CMC | Type |\n" in plain_output
+    assert "Unit Value" not in plain_output
+    assert "| Sol Ring | 3 | A1 |" in plain_output
+
 
 def test_cli_value_reports_total_and_missing(
     deck_dir: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
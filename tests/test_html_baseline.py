@@ -1,22 +1,26 @@
 from __future__ import annotations
 
 import hashlib
+import json
+import mmap
+import os
 from pathlib import Path
 
 # Snapshot of the HTML that matches the latest main branch merge.
-# If you intentionally change an HTML page, update the hash map below once
-# the new version is merged to main.
-EXPECTED_SHA256 = {
-    "site/index.html": "5dac7105e0fc9ed5b44699d4d6ad40e80747855c9c2cf05bdeadcd4b49f9cf37",
-    "site/upload.html": "11c1e198f686af066366fc90fdbae80e5984bb81e73f8d092fc7c172871b812b",
-    "site/decks.html": "5f78657dd5127a6c57d994761f869de57b11d942b41104f2f3536db626aa7214",
-    "site/inventory.html": "7ba446dadceedd2d14ea1ca6315ce22c9e3ddb29712c38c4578c188ffc0d67b0",
-    "site/functional-spec.html": "516c018082ae3bce3f38f6e50124016cf7e6965574d9406452df1fc03f987602",
-}
+# If you intentionally change an HTML page, refresh html_hashes.json with
+# scripts/refresh_html_hashes.py once the new version is merged to main.
+EXPECTED_SHA256 = json.loads(
+    Path(__file__).with_name("html_hashes.json").read_text(encoding="utf-8")
+)
 
 
 def sha256_hex(path: Path) -> str:
-    return hashlib.sha256(path.read_bytes()).hexdigest()
+    with path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            # mmap cannot map empty files.
+            return hashlib.sha256().hexdigest()
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped).hexdigest()
 
 
 def test_html_files_match_main_snapshot():
@@ -39,5 +43,5 @@ def test_html_files_match_main_snapshot():
         raise AssertionError(
             "HTML drift detected compared to main snapshot.\n"
             + formatted
-            + "\nUpdate EXPECTED_SHA256 only after merging intentional changes to main."
+            + "\nUpdate tests/html_hashes.json only after merging intentional changes to main."
         )
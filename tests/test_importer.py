@@ -1,4 +1,7 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
 from pathlib import Path
+import threading
 
 import pytest
 
@@ -27,6 +30,15 @@ def test_parse_import_rows_handles_csv_and_lines():
     ]
 
 
+def test_parse_import_rows_plain_lines_without_csv():
+    rows = importer.parse_import_rows("2 Sol Ring\r\n\n  4X Arcane Signet  \nMystic Remora\n")
+    assert rows == [
+        (2, "Sol Ring"),
+        (4, "Arcane Signet"),
+        (1, "Mystic Remora"),
+    ]
+
+
 def test_parse_import_rows_skips_headers_and_supports_name_count():
     rows = importer.parse_import_rows(
         "Count,Name\nSol Ring,2\nArcane Signet,4x\nName,Qty\nMystic Remora,1"
@@ -96,3 +108,228 @@ def test_import_deck_enforces_rules_and_rolls_back(tmp_path: Path):
 
     assert "exactly 3 cards" in str(excinfo.value)
     assert not (deck_dir / "too-short.md").exists()
+
+
+def test_import_deck_resolves_each_distinct_name_once(tmp_path: Path):
+    deck_dir = tmp_path / "decks"
+    deck_dir.mkdir()
+    queries: list[str] = []
+
+    class CountingResolver(importer.CardResolver):
+        def resolve(self, query: str):
+            queries.append(query)
+            return importer.CardData(name=query)
+
+    importer.import_deck(
+        library_root=deck_dir,
+        deck_name="Repeats",
+        commander="Boss",
+        card_source="Forest\nIsland\nforest\nForest\nBOSS",
+        resolver=CountingResolver(),
+    )
+
+    assert queries == ["Boss", "Forest", "Island"]
+
+
+def test_scryfall_resolver_memoises_successful_lookups(monkeypatch: pytest.MonkeyPatch):
+    resolver = importer.ScryfallResolver()
+    fetched: list[str] = []
+
+    def fake_fetch(query: str):
+        fetched.append(query)
+        return None if query == "missing" else importer.CardData(name="Sol Ring")
+
+    monkeypatch.setattr(resolver, "_fetch", fake_fetch)
+
+    assert resolver.resolve("Sol Ring").name == "Sol Ring"
+    assert resolver.resolve("  sol ring ").name == "Sol Ring"
+    assert resolver.resolve("missing") is None
+    assert resolver.resolve("missing") is None
+    assert fetched == ["Sol Ring", "missing", "missing"]
+
+
+def test_scryfall_resolve_many_batches_and_falls_back_to_fuzzy(monkeypatch: pytest.MonkeyPatch):
+    resolver = importer.ScryfallResolver()
+    monkeypatch.setattr(resolver, "COLLECTION_BATCH_SIZE", 2)
+    batches: list[list[str]] = []
+    fuzzy: list[str] = []
+
+    def fake_collection(queries: list[str]):
+        batches.append(list(queries))
+        return {
+            query.casefold(): importer.CardData(name=query.title())
+            for query in queries
+            if query != "sol rng"
+        }
+
+    def fake_fetch(query: str):
+        fuzzy.append(query)
+        return importer.CardData(name="Sol Ring")
+
+    monkeypatch.setattr(resolver, "_fetch_collection", fake_collection)
+    monkeypatch.setattr(resolver, "_fetch", fake_fetch)
+
+    results = resolver.resolve_many(["forest", "sol rng", "island", "forest"])
+
+    assert batches == [["forest", "sol rng"], ["island"]]
+    assert fuzzy == ["sol rng"]
+    assert {query: card.name for query, card in results.items()} == {
+        "forest": "Forest",
+        "sol rng": "Sol Ring",
+        "island": "Island",
+    }
+    assert resolver.resolve_many(["Forest"])["Forest"].name == "Forest"
+    assert len(batches) == 2
+
+
+def test_card_cache_round_trips_and_expires(tmp_path: Path):
+    cache_path = tmp_path / "cards.json"
+    fetched_at = importer._dt.datetime(2024, 3, 1, tzinfo=importer._dt.timezone.utc)
+    cache = importer.CardCache(cache_path)
+    cache.store("sol ring", importer.CardData(name="Sol Ring", prices={"usd": "1.50"}), now=fetched_at)
+    cache.save()
+
+    reloaded = importer.CardCache(cache_path)
+    fresh = reloaded.get("sol ring", now=fetched_at + importer._dt.timedelta(hours=23))
+    assert fresh == importer.CardData(name="Sol Ring", prices={"usd": "1.50"})
+    assert reloaded.get("sol ring", now=fetched_at + importer._dt.timedelta(hours=25)) is None
+    assert list(tmp_path.iterdir()) == [cache_path]
+
+
+def test_card_cache_treats_a_non_dict_file_as_empty(tmp_path: Path):
+    cache_path = tmp_path / "cards.json"
+    cache_path.write_text('["not", "a", "cache"]', encoding="utf-8")
+
+    cache = importer.CardCache(cache_path)
+    assert cache.get("sol ring") is None
+    cache.store("sol ring", importer.CardData(name="Sol Ring"))
+    assert cache.get("sol ring") == importer.CardData(name="Sol Ring")
+
+
+def test_card_cache_ignores_entries_with_unknown_card_fields(tmp_path: Path):
+    cache_path = tmp_path / "cards.json"
+    entry = {"fetched_at": "2024-03-01T00:00:00+00:00", "card": {"name": "Sol Ring", "rarity": "uncommon"}}
+    cache_path.write_text(importer.json.dumps({"sol ring": entry}), encoding="utf-8")
+
+    now = importer._dt.datetime(2024, 3, 1, 1, tzinfo=importer._dt.timezone.utc)
+    assert importer.CardCache(cache_path).get("sol ring", now=now) is None
+
+
+def test_card_cache_reads_naive_timestamps_as_utc(tmp_path: Path):
+    cache_path = tmp_path / "cards.json"
+    entry = {"fetched_at": "2024-03-01T00:00:00", "card": {"name": "Sol Ring"}}
+    cache_path.write_text(importer.json.dumps({"sol ring": entry}), encoding="utf-8")
+
+    cache = importer.CardCache(cache_path)
+    fetched_at = importer._dt.datetime(2024, 3, 1, tzinfo=importer._dt.timezone.utc)
+    assert cache.get("sol ring", now=fetched_at + importer._dt.timedelta(hours=1)) == importer.CardData(
+        name="Sol Ring"
+    )
+    assert cache.get("sol ring", now=fetched_at + importer._dt.timedelta(hours=25)) is None
+
+
+def test_card_cache_keeps_entries_stored_from_many_threads(tmp_path: Path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache_path = tmp_path / "cards.json"
+    cache_path.write_text("{}", encoding="utf-8")
+    cache = importer.CardCache(cache_path)
+    names = [f"Card {index}" for index in range(64)]
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(lambda name: cache.store(name.lower(), importer.CardData(name=name)), names))
+    cache.save()
+
+    reloaded = importer.CardCache(cache_path)
+    assert [reloaded.get(name.lower()) for name in names] == [importer.CardData(name=name) for name in names]
+
+
+def test_scryfall_resolver_consults_card_cache_before_fetching(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    cache = importer.CardCache(tmp_path / "cards.json")
+    cache.store("sol ring", importer.CardData(name="Sol Ring"))
+    resolver = importer.ScryfallResolver(cache=cache)
+    fetched: list[str] = []
+
+    def fake_fetch(query: str):
+        fetched.append(query)
+        return importer.CardData(name=query.title())
+
+    monkeypatch.setattr(resolver, "_fetch", fake_fetch)
+
+    assert resolver.resolve("Sol Ring").name == "Sol Ring"
+    assert resolver.resolve("Arcane Signet").name == "Arcane Signet"
+    assert fetched == ["Arcane Signet"]
+    assert cache.get("arcane signet") == importer.CardData(name="Arcane Signet")
+    cache.save()
+
+
+def test_scryfall_resolver_spaces_out_requests(monkeypatch: pytest.MonkeyPatch):
+    clock = [100.0]
+    sleeps: list[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(round(seconds, 3))
+        clock[0] += seconds
+
+    monkeypatch.setattr(importer.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(importer.time, "sleep", fake_sleep)
+    resolver = importer.ScryfallResolver()
+
+    resolver._wait_for_request_slot()
+    clock[0] += 0.03
+    resolver._wait_for_request_slot()
+    clock[0] += 0.5
+    resolver._wait_for_request_slot()
+
+    assert sleeps == [0.07]
+
+
+def test_scryfall_resolver_reuses_one_connection(monkeypatch: pytest.MonkeyPatch):
+    connections: list[tuple[str, int]] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            connections.append(self.client_address)
+
+        def do_GET(self):
+            if "missing" in self.path:
+                self._reply(404, {"object": "error"})
+            else:
+                self._reply(200, {"name": "Sol Ring", "prices": {"usd": "1.00"}})
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            names = [identifier["name"] for identifier in body["identifiers"]]
+            self._reply(200, {"data": [{"name": name} for name in names if name != "sol rng"]})
+
+        def _reply(self, status, payload):
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(importer.ScryfallResolver, "MIN_REQUEST_INTERVAL", 0)
+    try:
+        resolver = importer.ScryfallResolver(f"http://127.0.0.1:{server.server_port}")
+        assert resolver.resolve("missing card") is None
+        results = resolver.resolve_many(["Forest", "sol rng"])
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert results["Forest"].name == "Forest"
+    assert results["sol rng"] == importer.CardData(name="Sol Ring", prices={"usd": "1.00"})
+    assert len(connections) == 1
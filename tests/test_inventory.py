@@ -159,3 +159,99 @@ def test_inventory_load_handles_missing_numbers(tmp_path: Path):
     assert by_name["Island"].count == 5
     assert by_name["Island"].cmc is None
     assert by_name["Island"].type_line == "Basic Land"
+
+
+def test_inventory_search_prices_each_card_name_once(tmp_path: Path):
+    inventory = SparesInventory(tmp_path / "inventory.md")
+    inventory.add_cards(
+        [
+            SpareCard(name="Sol Ring", count=1, box="Binder"),
+            SpareCard(name="Sol Ring", count=2, box="Staples"),
+            SpareCard(name="Arcane Signet", count=1, box="Binder"),
+        ],
+        currency="gbp",
+        resolver=FakeResolver({}),
+    )
+
+    batches: list[list[str]] = []
+
+    class BatchResolver(FakeResolver):
+        def resolve_many(self, queries):
+            batches.append(list(queries))
+            return super().resolve_many(batches[-1])
+
+    entries, missing = inventory.search(
+        currency="gbp",
+        resolver=BatchResolver({"Sol Ring": CardData(name="Sol Ring", prices={"gbp": "1.50"})}),
+    )
+
+    assert batches == [["Arcane Signet", "Sol Ring"]]
+    assert [(entry.box, price) for entry, price in entries if entry.name == "Sol Ring"] == [
+        ("Binder", 1.5),
+        ("Staples", 1.5),
+    ]
+    assert missing == ["Arcane Signet"]
+
+
+def test_inventory_search_can_skip_prices(tmp_path: Path):
+    inventory = SparesInventory(tmp_path / "inventory.md")
+    inventory.add_cards(
+        [
+            SpareCard(name="Sol Ring", count=1, box="Binder", cmc=1),
+            SpareCard(name="Arcane Signet", count=1, box="Binder", cmc=2),
+        ],
+        currency="gbp",
+        resolver=FakeResolver({}),
+    )
+
+    class FailingResolver(FakeResolver):
+        def resolve_many(self, queries):  # pragma: no cover - must not be called
+            raise AssertionError("prices should not be looked up")
+
+    entries, missing = inventory.search(
+        resolver=FailingResolver({}), sort_by="cmc", with_prices=False
+    )
+
+    assert [(entry.name, price) for entry, price in entries] == [
+        ("Sol Ring", None),
+        ("Arcane Signet", None),
+    ]
+    assert missing == []
+
+    priced = SparesInventory(inventory.path).search(
+        resolver=FakeResolver({"Sol Ring": CardData(name="Sol Ring", prices={"gbp": "2.00"})}),
+        sort_by="value",
+        with_prices=False,
+    )[0]
+    assert priced[0] == (entries[0][0], 2.0)
+
+
+def test_inventory_search_limit_keeps_top_entries(tmp_path: Path):
+    inventory = SparesInventory(tmp_path / "inventory.md")
+    inventory.add_cards(
+        [
+            SpareCard(name="Sol Ring", count=2, box="Binder", cmc=1),
+            SpareCard(name="Arcane Signet", count=1, box="Binder", cmc=2),
+            SpareCard(name="Mana Crypt", count=1, box="Vault", cmc=0),
+            SpareCard(name="Island", count=10, box="Lands"),
+        ],
+        currency="gbp",
+        resolver=FakeResolver({}),
+    )
+    resolver = FakeResolver(
+        {
+            "Sol Ring": CardData(name="Sol Ring", prices={"gbp": "1.00"}),
+            "Mana Crypt": CardData(name="Mana Crypt", prices={"gbp": "150.00"}),
+            "Island": CardData(name="Island", prices={"gbp": "0.10"}),
+        }
+    )
+
+    by_value, _ = inventory.search(resolver=resolver, sort_by="value", limit=2)
+    assert [entry.name for entry, _ in by_value] == ["Mana Crypt", "Sol Ring"]
+
+    by_name, missing = inventory.search(resolver=resolver, sort_by="name", limit=2)
+    assert [entry.name for entry, _ in by_name] == ["Arcane Signet", "Island"]
+    assert missing == ["Arcane Signet"]
+
+    by_cmc, _ = inventory.search(resolver=resolver, sort_by="cmc", limit=4, with_prices=False)
+    assert [entry.name for entry, _ in by_cmc] == ["Mana Crypt", "Sol Ring", "Arcane Signet", "Island"]
@@ -5,6 +5,7 @@ import datetime as _dt
 import pytest
 
 from mtg_decks.deck import Deck
+import mtg_decks.library as library_module
 from mtg_decks.library import DeckLibrary
 from mtg_decks.valuation import DeckValuation
 
@@ -163,3 +164,96 @@ def test_value_all_uses_cache_and_saves(monkeypatch: pytest.MonkeyPatch, library
     assert valuations["Needs Valuation"].total == 2.22
     assert valuations["Needs Valuation"].currency == "usd"
     assert cache.saved is True
+
+
+def test_load_decks_reuses_unchanged_files(monkeypatch: pytest.MonkeyPatch, library: DeckLibrary) -> None:
+    deck_path = library.root / "reuse.md"
+    _write_basic_deck(deck_path, name="Reuse")
+
+    calls: list[Path] = []
+    original = Deck.from_file
+
+    def counting_from_file(path: Path) -> Deck:
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(Deck, "from_file", staticmethod(counting_from_file))
+
+    library.load_decks()
+    library.list_summary()
+    assert calls == [deck_path]
+
+    _write_basic_deck(deck_path, name="Reuse Again")
+    assert [deck.name for deck in library.load_decks()] == ["Reuse Again"]
+    assert len(calls) == 2
+
+
+def test_load_decks_returns_independent_copies(library: DeckLibrary) -> None:
+    _write_basic_deck(library.root / "copies.md", name="Copies")
+
+    first = library.load_decks()[0]
+    first.name = "Changed"
+    first.colors.append("R")
+
+    second = library.load_decks()[0]
+    assert second.name == "Copies"
+    assert second.colors == ["U"]
+
+
+def test_value_all_keeps_deck_file_order(monkeypatch: pytest.MonkeyPatch, library: DeckLibrary) -> None:
+    names = [f"Deck {index:02d}" for index in range(20)]
+    for name in names:
+        _write_basic_deck(library.root / f"{name.replace(' ', '-').lower()}.md", name=name)
+
+    class FakeValuer:
+        def __init__(self, resolver=None) -> None:
+            self.resolver = resolver
+
+        def value_counts(self, *_args, **_kwargs):
+            return DeckValuation(currency="usd", total=1.0, missing_prices=[])
+
+    monkeypatch.setattr("mtg_decks.library.DeckValuer", FakeValuer)
+
+    valuations = library.value_all(currency="USD")
+
+    assert list(valuations) == names
+
+
+def test_value_all_reuses_parsed_decklists(monkeypatch: pytest.MonkeyPatch, library: DeckLibrary) -> None:
+    _write_basic_deck(library.root / "reuse-list.md", name="Reuse List")
+
+    parsed: list[Path] = []
+    original = library_module.load_decklist
+
+    def counting_load_decklist(path: Path):
+        parsed.append(path)
+        return original(path)
+
+    class FakeValuer:
+        def __init__(self, resolver=None) -> None:
+            self.resolver = resolver
+
+        def value_counts(self, card_counts, **_kwargs):
+            return DeckValuation(currency="usd", total=float(sum(card_counts.values())), missing_prices=[])
+
+    monkeypatch.setattr(library_module, "load_decklist", counting_load_decklist)
+    monkeypatch.setattr(library_module, "DeckValuer", FakeValuer)
+
+    first = library.value_all(currency="USD")
+    second = library.value_all(currency="USD")
+
+    assert first["Reuse List"].total == second["Reuse List"].total == 2.0
+    assert parsed == [library.root / "reuse-list.md"]
+
+
+def test_load_decklist_returns_independent_copies(library: DeckLibrary) -> None:
+    deck_path = library.root / "list-copies.md"
+    _write_basic_deck(deck_path, name="List Copies")
+
+    counts, commanders = library_module._load_decklist(deck_path)
+    counts["Sol Ring"] = 99
+    commanders.add("Intruder")
+
+    counts, commanders = library_module._load_decklist(deck_path)
+    assert counts["Sol Ring"] == 1
+    assert "Intruder" not in commanders
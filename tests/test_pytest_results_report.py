@@ -218,11 +218,88 @@ def test_trace_functions_ignore_non_package_frames(tmp_path: Path) -> None:
 
         inside = DummyFrame(package_root / "inside.py", lineno=12)
         handler = _pytest_results._trace_calls(inside, "call", None)
-        assert handler is _pytest_results._trace_lines
+        assert handler is not _pytest_results._trace_calls
 
-        _pytest_results._trace_lines(inside, "line", None)
-        recorded = _pytest_results._TRACE_DATA[Path(inside.f_code.co_filename).resolve()]
+        assert handler(inside, "line", None) is handler
+        recorded = _pytest_results._TRACE_DATA[str(Path(inside.f_code.co_filename).resolve())]
         assert inside.f_lineno in recorded
     finally:
+        _pytest_results._LINE_TRACERS.pop(str(package_root / "inside.py"), None)
         _pytest_results._PACKAGE_ROOT = original_root
         _pytest_results._TRACE_DATA = original_data
+
+
+def test_package_classification_is_cached_per_filename(monkeypatch, tmp_path: Path) -> None:
+    calls: list[str] = []
+    real_classify = _pytest_results._classify
+
+    def counting_classify(filename: str):
+        calls.append(filename)
+        return real_classify(filename)
+
+    monkeypatch.setattr(_pytest_results, "_classify", counting_classify)
+    filename = str(tmp_path / "outside.py")
+
+    assert _pytest_results._in_package(filename) is None
+    assert _pytest_results._in_package(filename) is None
+    assert calls == [filename]
+
+
+def test_code_lines_are_cached_until_the_file_changes(tmp_path: Path) -> None:
+    source = tmp_path / "module.py"
+    source.write_text("x = 1\n", encoding="utf-8")
+
+    first = _pytest_results._code_lines(source)
+    assert _pytest_results._code_lines(source) is first
+
+    source.write_text("x = 1\ny = 2\n", encoding="utf-8")
+    assert _pytest_results._code_lines(source) == {1, 2}
+
+
+def test_finalize_coverage_dump_round_trips_through_aggregation(monkeypatch, tmp_path: Path) -> None:
+    package_root = Path(__file__).resolve().parents[1] / "src" / "mtg_decks"
+    sample_file = package_root / "site_checks.py"
+    trace_data = {str(sample_file): set(_pytest_results._code_lines(sample_file))}
+    monkeypatch.setenv("PYTEST_COVERAGE_DUMP", str(tmp_path / "trace-w1.json"))
+
+    percent = _pytest_results.finalize_coverage(trace_data, package_root)
+
+    assert percent == 100
+    assert _pytest_results.aggregate_coverage(tmp_path) == percent
+
+
+def test_code_lines_are_reused_from_the_on_disk_cache(monkeypatch, tmp_path: Path) -> None:
+    package_root = tmp_path / "src" / "pkg"
+    package_root.mkdir(parents=True)
+    module = package_root / "module.py"
+    module.write_text("x = 1\ny = 2\n", encoding="utf-8")
+    trace_data = {str(module): {1}}
+
+    assert _pytest_results._calculate_coverage_percent(trace_data, package_root) == 75
+    assert (tmp_path / ".pytest_cache" / _pytest_results.CODE_LINES_CACHE_FILENAME).exists()
+
+    def fail_scan(raw: bytes) -> set[int]:
+        raise AssertionError("source should not be tokenized again")
+
+    monkeypatch.setattr(_pytest_results, "_CODE_LINES_CACHE", {})
+    monkeypatch.setattr(_pytest_results, "_scan_code_lines", fail_scan)
+
+    assert _pytest_results._calculate_coverage_percent(trace_data, package_root) == 75
+
+
+def test_worker_dumps_leave_the_code_line_cache_to_the_controller(monkeypatch, tmp_path: Path) -> None:
+    package_root = tmp_path / "src" / "pkg"
+    package_root.mkdir(parents=True)
+    module = package_root / "module.py"
+    module.write_text("x = 1\ny = 2\n", encoding="utf-8")
+    cache_path = tmp_path / ".pytest_cache" / _pytest_results.CODE_LINES_CACHE_FILENAME
+    dump_dir = tmp_path / "traces"
+    dump_dir.mkdir()
+    monkeypatch.setenv("PYTEST_COVERAGE_DUMP", str(dump_dir / "trace-w1.json"))
+
+    assert _pytest_results.finalize_coverage({str(module): {1}}, package_root) == 75
+    assert not cache_path.exists()
+
+    monkeypatch.delenv("PYTEST_COVERAGE_DUMP")
+    assert _pytest_results.aggregate_coverage(dump_dir) == 75
+    assert cache_path.exists()
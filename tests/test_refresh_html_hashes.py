@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import sys
 from pathlib import Path
 
@@ -16,22 +17,22 @@ def _write_fake_baseline(root: Path, mapping: dict[str, str]) -> None:
     tests_dir = root / "tests"
     tests_dir.mkdir(parents=True, exist_ok=True)
     (tests_dir / "__init__.py").write_text("", encoding="utf-8")
+    (tests_dir / "html_hashes.json").write_text(json.dumps(mapping), encoding="utf-8")
 
     baseline = tests_dir / "test_html_baseline.py"
-    mapping_lines = ["EXPECTED_SHA256 = {"]
-    for rel_path, digest in mapping.items():
-        mapping_lines.append(f'    "{rel_path}": "{digest}",')
-    mapping_lines.append("}")
     baseline.write_text(
         "\n".join(
             [
                 "from pathlib import Path",
                 "import hashlib",
+                "import json",
                 "",
                 "def sha256_hex(path: Path) -> str:",
                 "    return hashlib.sha256(path.read_bytes()).hexdigest()",
                 "",
-                *mapping_lines,
+                "EXPECTED_SHA256 = json.loads(",
+                "    Path(__file__).with_name('html_hashes.json').read_text(encoding='utf-8')",
+                ")",
                 "",
             ]
         ),
@@ -64,16 +65,48 @@ def test_gather_hashes_reports_missing_and_uses_sha(tmp_path, monkeypatch):
     assert missing == ["missing.html"]
 
 
-def test_rewrite_test_file_replaces_mapping_block(tmp_path, monkeypatch):
+def test_gather_hashes_reuses_cached_digests_for_unchanged_files(tmp_path, monkeypatch):
+    index = tmp_path / "index.html"
+    index.write_text("<html>index</html>\n", encoding="utf-8")
+    _write_fake_baseline(tmp_path, {"index.html": "placeholder"})
+    _reset_imports()
+    monkeypatch.setattr(refresh, "ROOT", tmp_path)
+
+    expected = refresh._load_baseline_module().EXPECTED_SHA256
+    first, _ = refresh._gather_hashes(expected)
+    assert (tmp_path / refresh.CACHE_PATH).exists()
+
+    class ExplodingBaseline:
+        @staticmethod
+        def sha256_hex(path):
+            raise AssertionError(f"{path} should have been served from the cache")
+
+    monkeypatch.setattr(refresh, "_load_baseline_module", lambda: ExplodingBaseline)
+    second, _ = refresh._gather_hashes(expected)
+    assert second == first
+
+    index.write_text("<html>index, edited</html>\n", encoding="utf-8")
+    monkeypatch.setattr(
+        refresh,
+        "_load_baseline_module",
+        lambda: type("Baseline", (), {"sha256_hex": staticmethod(lambda path: "fresh")}),
+    )
+    third, _ = refresh._gather_hashes(expected)
+    assert third == {"index.html": "fresh"}
+
+
+def test_write_mapping_replaces_hashes_file(tmp_path, monkeypatch):
     original_mapping = {"index.html": "old", "inventory.html": "old"}
     _write_fake_baseline(tmp_path, original_mapping)
     _reset_imports()
     monkeypatch.setattr(refresh, "ROOT", tmp_path)
 
     new_mapping = {"index.html": "newhash", "inventory.html": "newhash", "extra.html": "added"}
-    refresh._rewrite_test_file(new_mapping)
+    refresh._write_mapping(new_mapping)
+
+    hashes_path = tmp_path / "tests" / "html_hashes.json"
+    assert json.loads(hashes_path.read_text(encoding="utf-8")) == new_mapping
+    assert list(tmp_path.joinpath("tests").glob("*.tmp")) == []
 
-    updated = (tmp_path / "tests" / "test_html_baseline.py").read_text(encoding="utf-8")
-    assert "\"extra.html\": \"added\"" in updated
-    assert "\"inventory.html\": \"old\"" not in updated
-    assert updated.strip().endswith("}")
+    _reset_imports()
+    assert refresh._load_baseline_module().EXPECTED_SHA256 == new_mapping
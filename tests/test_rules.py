@@ -5,7 +5,7 @@ import pytest
 
 from mtg_decks.deck import Deck
 from mtg_decks.library import DeckLibrary
-from mtg_decks.rules import CommanderRules, parse_decklist
+from mtg_decks.rules import CommanderRules, ValidationCache, parse_decklist
 
 
 def test_parse_decklist_extracts_counts_and_commander():
@@ -31,6 +31,36 @@ def test_parse_decklist_extracts_counts_and_commander():
     assert card_counts["Sol Ring"] == 1
 
 
+def test_parse_decklist_handles_bullet_edge_cases():
+    markdown = textwrap.dedent(
+        """
+        # Sample Deck
+
+        Intro text with ## Decklist inline is not a heading.
+
+          ## DECKLIST
+        - [commander]   2 Atraxa, Praetors' Voice
+        -- 4x   Plains
+        - 3xIsland
+        - 12
+        - 1997 Commemorative
+        ## Notes
+        - Ignored
+    """
+    )
+
+    card_counts, commanders = parse_decklist(markdown)
+
+    assert commanders == {"Atraxa, Praetors' Voice"}
+    assert card_counts == {
+        "Atraxa, Praetors' Voice": 2,
+        "Plains": 4,
+        "3xIsland": 1,
+        "12": 1,
+        "Commemorative": 1997,
+    }
+
+
 def test_commander_rules_flag_size_and_duplicate_issues():
     deck = Deck(
         name="Limit Break",
@@ -79,6 +109,86 @@ def test_validate_decks_enforces_commander_rules(tmp_path: Path):
     assert errors == []
 
 
+def test_validate_decks_reuses_cached_results_for_unchanged_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    deck_dir = tmp_path / "decks"
+    deck_dir.mkdir()
+    deck_path = deck_dir / "short.md"
+    deck_path.write_text(
+        "---\nname: Short\ncommander: Boss\n---\n\n## Decklist\n- [Commander] Boss\n",
+        encoding="utf-8",
+    )
+    cache_path = deck_dir / ".validation-cache.json"
+    library = DeckLibrary(deck_dir)
+
+    first = library.validate_decks(rules=CommanderRules(), cache=ValidationCache(cache_path))
+    assert any("exactly 100 cards" in err for err in first)
+
+    validated: list[Path] = []
+    original = DeckLibrary._validate_deck_file
+
+    def tracking_validate(self, path, rules):
+        validated.append(path)
+        return original(self, path, rules)
+
+    monkeypatch.setattr(DeckLibrary, "_validate_deck_file", tracking_validate)
+
+    again = library.validate_decks(rules=CommanderRules(), cache=ValidationCache(cache_path))
+    assert again == first
+    assert validated == []
+
+    library.validate_decks(rules=CommanderRules(deck_size=1), cache=ValidationCache(cache_path))
+    assert validated == [deck_path]
+
+
+def test_validate_decks_reports_decks_that_vanish_before_stat(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    deck_dir = tmp_path / "decks"
+    deck_dir.mkdir()
+    kept = deck_dir / "kept.md"
+    kept.write_text(
+        "---\nname: Kept\ncommander: Boss\n---\n\n## Decklist\n- [Commander] Boss\n",
+        encoding="utf-8",
+    )
+    vanished = deck_dir / "vanished.md"
+    library = DeckLibrary(deck_dir)
+    monkeypatch.setattr(DeckLibrary, "deck_files", lambda self: [kept, vanished])
+
+    errors = library.validate_decks(
+        rules=CommanderRules(deck_size=1), cache=ValidationCache(deck_dir / ".validation-cache.json")
+    )
+
+    assert len(errors) == 1
+    assert errors[0].startswith(f"{vanished}: ")
+
+
+def test_validation_cache_skips_save_when_nothing_changed(tmp_path: Path):
+    deck_path = tmp_path / "deck.md"
+    deck_path.write_text("---\nname: Deck\ncommander: Boss\n---\n", encoding="utf-8")
+    cache_path = tmp_path / ".validation-cache.json"
+
+    cache = ValidationCache(cache_path)
+    cache.use_rules("rules")
+    cache.store(deck_path, deck_path.stat(), [])
+    cache.save()
+    written = cache_path.stat().st_mtime_ns
+
+    cache_path.chmod(0o444)
+    reloaded = ValidationCache(cache_path)
+    reloaded.use_rules("rules")
+    assert reloaded.get(deck_path, deck_path.stat()) == []
+    reloaded.save()
+    assert cache_path.stat().st_mtime_ns == written
+
+
+def test_validation_cache_save_ignores_write_errors(tmp_path: Path):
+    cache = ValidationCache(tmp_path / "missing-dir" / ".validation-cache.json")
+    cache.use_rules("rules")
+    cache.save()
+
+
 def _filler_counts(starting: dict[str, int], total: int = 100) -> dict[str, int]:
     counts = dict(starting)
     counts["Plains"] = counts.get("Plains", 0) + max(0, total - sum(counts.values()))
@@ -105,6 +215,22 @@ def test_banned_cards_are_rejected():
     assert any("Black Lotus" in err for err in errors)
 
 
+def test_banned_cards_added_after_construction_are_rejected():
+    deck = Deck(name="Late Ban", commander="Cloud, Ex-SOLDIER")
+    card_counts = _filler_counts({"Cloud, Ex-SOLDIER": 1, "Sol Ring": 1})
+
+    rules = CommanderRules()
+    assert rules.validate(deck, card_counts, commander_entries={"Cloud, Ex-SOLDIER"}) == []
+
+    rules.banned_cards.add("Sol Ring")
+    errors = rules.validate(deck, card_counts, commander_entries={"Cloud, Ex-SOLDIER"})
+    assert any("Sol Ring" in err for err in errors)
+
+    rules.basic_lands = {"Island"}
+    errors = rules.validate(deck, card_counts, commander_entries={"Cloud, Ex-SOLDIER"})
+    assert any("Plains" in err for err in errors)
+
+
 def test_partner_commanders_must_respect_limit():
     deck = Deck(name="Partners", commander="Tymna the Weaver")
     commanders = {"Tymna the Weaver", "Kraum, Ludevic's Opus"}
@@ -1,3 +1,4 @@
+import logging
 from pathlib import Path
 
 import mtg_decks.site_checks as site_checks
@@ -58,3 +59,23 @@ def test_validate_prefers_existing_cwd(monkeypatch, tmp_path: Path):
     assert site_checks.validate_site_assets(log_path=log_path)
     contents = log_path.read_text(encoding="utf-8")
     assert str(site_root) in contents
+
+
+def test_repeat_checks_reuse_logger_handlers(tmp_path: Path):
+    site_root = Path(__file__).resolve().parents[1] / "site"
+    log_path = tmp_path / "error.log"
+
+    validate_site_assets(site_root=site_root, log_path=log_path)
+    handlers = list(site_checks._configure_logger(log_path).handlers)
+    validate_site_assets(site_root=site_root, log_path=log_path)
+
+    assert site_checks._configure_logger(log_path).handlers == handlers
+    assert log_path.read_text(encoding="utf-8").count("All site assets present") == 2
+
+    other_log = tmp_path / "other.log"
+    validate_site_assets(site_root=site_root, log_path=other_log)
+    file_handler = next(h for h in handlers if isinstance(h, logging.FileHandler))
+    stream_handler = next(h for h in handlers if not isinstance(h, logging.FileHandler))
+    assert file_handler.stream is None
+    assert stream_handler in site_checks._configure_logger(other_log).handlers
+    assert "All site assets present" in other_log.read_text(encoding="utf-8")
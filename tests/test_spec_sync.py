@@ -38,11 +38,30 @@ def test_error_is_logged_when_files_diverge(tmp_path: Path):
     assert "out of sync" in contents
 
 
+def test_write_error_appends_to_existing_log(tmp_path: Path):
+    error_log = tmp_path / "error.log"
+
+    spec_sync.write_error("first", error_log=error_log)
+    spec_sync.write_error("second", error_log=error_log)
+
+    assert error_log.read_text(encoding="utf-8") == "first\nsecond\n"
+
+
+def test_slugify_collapses_punctuation_and_non_ascii():
+    slugify = spec_sync.SimpleMarkdown._slugify
+
+    assert slugify("Deck Rules & Limits") == "deck-rules-limits"
+    assert slugify("Café -- naïve!") == "caf-na-ve"
+    assert slugify("  ***  ") == "section"
+
+
 def test_missing_markdown_is_reported_gracefully(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
     md_path = tmp_path / "missing.md"
     html_path = tmp_path / "spec.html"
 
-    exit_code = spec_sync.main(["--rewrite-md", "--write", "--md", str(md_path), "--html", str(html_path)])
+    exit_code = spec_sync.main(
+        ["--rewrite-md", "--write", "--md", str(md_path), "--html", str(html_path), "--manifest", str(tmp_path / "m.json")]
+    )
 
     captured = capsys.readouterr()
     assert exit_code == 1
@@ -59,6 +78,7 @@ def test_local_fallback_is_used_when_packaged_defaults_are_missing(monkeypatch:
     fake_html = Path("/opt/hostedtoolcache/Python/3.11.14/x64/lib/python3.11/functional-spec.html")
 
     monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(spec_sync, "DEFAULT_SYNC_MANIFEST", tmp_path / "spec-sync.json")
 
     exit_code = spec_sync.main(["--rewrite-md", "--write", "--md", str(fake_md), "--html", str(fake_html)])
 
@@ -67,3 +87,28 @@ def test_local_fallback_is_used_when_packaged_defaults_are_missing(monkeypatch:
     assert generated_html.exists()
     contents = generated_html.read_text(encoding="utf-8")
     assert "Functional Specification" in contents
+
+
+def test_unchanged_pair_skips_rendering(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    md_path = tmp_path / "spec.md"
+    html_path = tmp_path / "spec.html"
+    manifest = tmp_path / "manifest.json"
+    md_path.write_text("# Heading\n\nDetails", encoding="utf-8")
+
+    spec_sync.regenerate_html(md_path, html_path, manifest_path=manifest)
+
+    def fail_render(_text: str) -> str:  # pragma: no cover - must not be called
+        raise AssertionError("unchanged spec should not be re-rendered")
+
+    monkeypatch.setattr(spec_sync, "render_spec_html", fail_render)
+    assert spec_sync.spec_is_in_sync(md_path, html_path, tmp_path / "error.log", manifest_path=manifest)
+
+    monkeypatch.undo()
+    md_path.write_text("# Heading\n\nChanged details", encoding="utf-8")
+    assert not spec_sync.spec_is_in_sync(md_path, html_path, tmp_path / "error.log", manifest_path=manifest)
+
+
+def test_inline_markup_is_escaped_once():
+    rendered = spec_sync.SimpleMarkdown._inline('Run `show <name>` on **"A & B"**')
+
+    assert rendered == 'Run <code>show &lt;name&gt;</code> on <strong>&quot;A &amp; B&quot;</strong>'
@@ -1,4 +1,5 @@
 import datetime as _dt
+import json
 import textwrap
 from pathlib import Path
 
@@ -10,6 +11,7 @@ from mtg_decks.valuation import (
     DeckValuation,
     DeckValuer,
     ValuationCache,
+    price_formatter,
     render_valuation_report,
 )
 
@@ -39,6 +41,45 @@ def test_deck_valuer_sums_prices_and_tracks_missing():
     assert "Mystic Remora" in valuation.missing_prices
 
 
+def test_deck_valuer_reuses_prices_across_decks():
+    lookups: list[str] = []
+
+    class CountingResolver(FakePriceResolver):
+        def resolve(self, query: str):
+            lookups.append(query)
+            return super().resolve(query)
+
+    valuer = DeckValuer(
+        resolver=CountingResolver({"Sol Ring": CardData(name="Sol Ring", prices={"gbp": "1.50"})})
+    )
+
+    valuer.value_counts({"Sol Ring": 1, "Mystic Remora": 1})
+    second = valuer.value_counts({"sol ring": 2, "Mystic Remora": 1})
+
+    assert second.total == pytest.approx(3.0)
+    assert second.missing_prices == ["Mystic Remora"]
+    assert valuer.price_cards(["Sol Ring"]) == {"Sol Ring": 1.5}
+    assert lookups == ["Sol Ring", "Mystic Remora"]
+
+
+def test_value_counts_resolves_the_deck_in_one_batch():
+    batches: list[list[str]] = []
+
+    class BatchResolver(FakePriceResolver):
+        def resolve_many(self, queries):
+            batches.append(list(queries))
+            return super().resolve_many(batches[-1])
+
+    valuer = DeckValuer(
+        resolver=BatchResolver({"Sol Ring": CardData(name="Sol Ring", prices={"gbp": "1.50"})})
+    )
+    valuation = valuer.value_counts({"Sol Ring": 2, "Mystic Remora": 1})
+
+    assert batches == [["Sol Ring", "Mystic Remora"]]
+    assert valuation.total == pytest.approx(3.0)
+    assert valuation.missing_prices == ["Mystic Remora"]
+
+
 def test_library_value_deck_supports_configurable_currency(tmp_path: Path):
     deck_dir = tmp_path / "decks"
     deck_dir.mkdir()
@@ -148,6 +189,14 @@ def test_render_valuation_report_orders_and_formats_results():
     assert "Price lookups needed (1):" in report
 
 
+def test_render_valuation_report_normalises_aware_timestamps_to_utc():
+    as_of = _dt.datetime(2024, 1, 1, 1, 30, tzinfo=_dt.timezone(_dt.timedelta(hours=1)))
+
+    report = render_valuation_report({}, currency="usd", as_of=as_of)
+
+    assert "As of: 2024-01-01T00:30:00Z" in report
+
+
 def test_value_all_reuses_cache_within_month(tmp_path: Path):
     deck_dir = tmp_path / "decks"
     deck_dir.mkdir()
@@ -249,3 +298,28 @@ def test_value_all_refreshes_cache_for_outdated_month(tmp_path: Path):
     cached_entry = refreshed_cache.get("Stale Deck", currency="usd", now=as_of)
     assert cached_entry is not None
     assert cached_entry.total == pytest.approx(4.0)
+
+
+def test_price_formatter_resolves_currency_once():
+    format_gbp = price_formatter("GBP")
+    format_other = price_formatter("jpy")
+
+    assert format_gbp(1234.5) == "£1,234.50"
+    assert format_gbp(None) == "Unknown"
+    assert format_other(3) == "JPY 3.00"
+
+
+def test_valuation_cache_only_saves_after_changes(tmp_path: Path):
+    cache_path = tmp_path / "valuation-cache.json"
+    cache = ValuationCache(cache_path)
+
+    cache.save()
+    assert not cache_path.exists()
+
+    cache.store("Deck", DeckValuation(currency="gbp", total=1.0), as_of=_dt.datetime(2024, 5, 1))
+    cache.save()
+    written = cache_path.stat().st_mtime_ns
+
+    cache.save()
+    assert cache_path.stat().st_mtime_ns == written
+    assert json.loads(cache_path.read_text(encoding="utf-8"))["decks"]["Deck"]["total"] == 1.0